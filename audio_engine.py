@@ -82,8 +82,9 @@ class AudioEngine:
         self._silence_callback: Optional[Callable[[bool, float, bool, float], None]] = None
         self._error_callback: Optional[Callable[[str], None]] = None
         
-        # Mic gain (1.0 = unity, 0.5 = -6dB, 2.0 = +6dB)
-        self._mic_gain: float = 1.0
+        # Mic gain (1.0 = unity, 0.5 = -6dB, 2.0 = +6dB). Kept as a float32
+        # scalar so scaling int16 blocks yields float32, not float64, arrays
+        self._mic_gain = np.float32(1.0)
         
         # Noise gate for mic
         self._noise_gate = NoiseGate(
@@ -91,7 +92,8 @@ class AudioEngine:
             attack_ms=5.0,
             release_ms=50.0,
             hold_ms=100.0,
-            sample_rate=self.SAMPLE_RATE
+            sample_rate=self.SAMPLE_RATE,
+            max_chunk=self.CHUNK_SIZE * self.CHANNELS
         )
         self._noise_gate_enabled: bool = False
         
@@ -326,16 +328,16 @@ class AudioEngine:
                 # Read audio data from primary source
                 data = self._stream.read(self.CHUNK_SIZE, exception_on_overflow=False)
                 
-                # Convert to numpy for processing
-                sys_array = np.frombuffer(data, dtype=np.int16).astype(np.int32)
+                # Convert to numpy for processing (zero-copy int16 view)
+                sys_samples = np.frombuffer(data, dtype=np.int16)
                 
-                # Process System Audio Silence
-                _, sys_warning, sys_duration = self.sys_silence_detector.process_chunk(
-                    sys_array.astype(np.int16), self.CHUNK_SIZE
+                # Process System Audio Silence (also yields the level for the meter)
+                sys_db, sys_warning, sys_duration = self.sys_silence_detector.process_chunk(
+                    sys_samples, self.CHUNK_SIZE
                 )
                 
-                # Prepare mixed array (start with system audio)
-                mixed_array = sys_array
+                # Prepare mixed array (start with system audio, widened for mixing)
+                mixed_array = sys_samples.astype(np.int32)
                 
                 # Initialize mic status (default to no warning if not active)
                 mic_warning = False
@@ -350,28 +352,34 @@ class AudioEngine:
                 if mic_stream:
                     try:
                         mic_data = mic_stream.read(self.CHUNK_SIZE, exception_on_overflow=False)
-                        mic_array = np.frombuffer(mic_data, dtype=np.int16).astype(np.int32)
+                        # Stay in int16 until mixing; widen at most once
+                        mic_array = np.frombuffer(mic_data, dtype=np.int16)
                         
                         # Handle Mono Mic -> Stereo Output
                         if self._mic_channels == 1:
-                            mic_array = np.column_stack((mic_array, mic_array)).flatten()
+                            mic_array = np.repeat(mic_array, 2)
                         
                         # Apply noise gate if enabled
                         if self._noise_gate_enabled:
-                            mic_array = self._noise_gate.process(mic_array.astype(np.int16)).astype(np.int32)
+                            mic_array = self._noise_gate.process(mic_array)
                         
-                        # Apply mic gain
                         if self._mic_gain != 1.0:
+                            # Apply mic gain
                             mic_array = (mic_array * self._mic_gain).astype(np.int32)
                             
-                        # Process Mic Silence
-                        _, mic_warning, mic_duration = self.mic_silence_detector.process_chunk(
-                            mic_array.astype(np.int16), self.CHUNK_SIZE
-                        )
-                        
-                        # Calculate mic level for meters
-                        mic_rms = self.mic_silence_detector.calculate_rms(mic_array)
-                        mic_db = self.mic_silence_detector.rms_to_db(mic_rms)
+                            # Process Mic Silence
+                            _, mic_warning, mic_duration = self.mic_silence_detector.process_chunk(
+                                mic_array.astype(np.int16), self.CHUNK_SIZE, need_db=False
+                            )
+                            
+                            # Calculate mic level for meters
+                            mic_rms = self.mic_silence_detector.calculate_rms(mic_array)
+                            mic_db = self.mic_silence_detector.rms_to_db(mic_rms)
+                        else:
+                            # Unity gain: the detector's level is the meter level
+                            mic_db, mic_warning, mic_duration = self.mic_silence_detector.process_chunk(
+                                mic_array, self.CHUNK_SIZE
+                            )
                         has_mic_data = True
                         
                         # Mix audio (simple addition)
@@ -387,10 +395,6 @@ class AudioEngine:
                 # Store mixed audio
                 self._audio_frames.append(final_audio.tobytes())
                 
-                # Calculate system level
-                sys_rms = self.sys_silence_detector.calculate_rms(sys_array)
-                sys_db = self.sys_silence_detector.rms_to_db(sys_rms)
-                
                 # Notify callbacks
                 if self._level_callback:
                     self._level_callback(sys_db, mic_db)
@@ -504,12 +508,12 @@ class AudioEngine:
     @property
     def mic_gain(self) -> float:
         """Get mic gain multiplier."""
-        return self._mic_gain
+        return float(self._mic_gain)
     
     @mic_gain.setter
     def mic_gain(self, value: float) -> None:
         """Set mic gain (0.0 to 3.0)."""
-        self._mic_gain = max(0.0, min(3.0, value))
+        self._mic_gain = np.float32(max(0.0, min(3.0, value)))
     
     @property
     def noise_gate_enabled(self) -> bool:
@@ -4,9 +4,13 @@ Applies a noise gate to audio data to suppress background noise.
 Uses smooth gain ramping to avoid clicks/pops.
 """
 
+import math
+
 import numpy as np
 from typing import Optional
 
+import noise_gate_numba
+
 
 class NoiseGate:
     """
@@ -23,7 +27,8 @@ class NoiseGate:
                  attack_ms: float = 5.0,
                  release_ms: float = 50.0,
                  hold_ms: float = 100.0,
-                 sample_rate: int = 22050):
+                 sample_rate: int = 22050,
+                 max_chunk: int = 2048):
         """
         Initialize the noise gate.
         
@@ -33,6 +38,7 @@ class NoiseGate:
             release_ms: Time for gate to fully close (ms).
             hold_ms: Minimum time gate stays open after signal drops below threshold (ms).
             sample_rate: Audio sample rate.
+            max_chunk: Expected maximum samples per chunk (buffers grow if exceeded).
         """
         self.threshold_db = threshold_db
         self.sample_rate = sample_rate
@@ -47,6 +53,16 @@ class NoiseGate:
         self._hold_counter = 0  # Samples remaining in hold period
         self._is_open = False
         
+        # Preallocated work buffers so process() doesn't allocate per chunk
+        self._allocate_buffers(max_chunk)
+        
+    def _allocate_buffers(self, size: int) -> None:
+        """(Re)allocate the scratch buffers used by process()."""
+        self._scratch_f32 = np.empty(size, dtype=np.float32)
+        self._scratch_i16 = np.empty(size, dtype=np.int16)
+        self._ramp_base = np.arange(size, dtype=np.float32)
+        self._zeros_i16 = np.zeros(size, dtype=np.int16)
+        
     @property
     def is_open(self) -> bool:
         """Whether the gate is currently open."""
@@ -62,24 +78,36 @@ class NoiseGate:
         """Convert RMS to dB."""
         if rms <= 0:
             return -100.0
-        return 20 * np.log10(rms / reference)
+        return 20 * math.log10(rms / reference)
     
     def process(self, audio_data: np.ndarray) -> np.ndarray:
         """
         Process audio through the noise gate.
         
         Args:
-            audio_data: Audio samples as int16 numpy array.
+            audio_data: Audio samples as a contiguous int16 numpy array
+                (strided views are copied to keep NumPy on its SIMD kernels).
             
         Returns:
-            Gated audio as int16 numpy array.
+            Gated audio as int16 numpy array. This is either the input array
+            itself (gate fully open) or a view into an internal buffer that
+            may be reused by the next call; copy it if needed.
         """
         if len(audio_data) == 0:
             return audio_data
         
-        # Calculate RMS of the chunk
-        float_data = audio_data.astype(np.float32)
-        rms = np.sqrt(np.mean(np.square(float_data)))
+        if not audio_data.flags.c_contiguous:
+            audio_data = np.ascontiguousarray(audio_data)
+        
+        n = len(audio_data)
+        
+        # Calculate RMS of the chunk (single int64 reduction, no float temporaries)
+        if noise_gate_numba.AVAILABLE:
+            sum_sq = noise_gate_numba.sum_of_squares(audio_data)
+        else:
+            samples = audio_data.astype(np.int64, copy=False)
+            sum_sq = int(np.dot(samples, samples))
+        rms = math.sqrt(sum_sq / n)
         db_level = self._rms_to_db(rms)
         
         # Determine target gain
@@ -92,30 +120,55 @@ class NoiseGate:
         elif self._hold_counter > 0:
             # Still in hold period
             target_gain = 1.0
-            self._hold_counter -= len(audio_data)
+            self._hold_counter -= n
             self._is_open = True
         else:
             target_gain = 0.0
             self._is_open = False
         
+        # Steady state: fully closed or fully open needs no per-sample work
+        if target_gain == self._gain:
+            if target_gain == 0.0:
+                if n > len(self._zeros_i16):
+                    self._allocate_buffers(n)
+                return self._zeros_i16[:n]
+            if target_gain == 1.0:
+                return audio_data
+        
         # Apply smooth gain ramping
+        # (gain delta / per-sample step == gain delta * ramp length in samples)
         if target_gain > self._gain:
             # Opening — use attack time
-            step = 1.0 / self._attack_samples
-            ramp_samples = min(len(float_data), int((target_gain - self._gain) / step))
+            ramp_samples = min(n, int((target_gain - self._gain) * self._attack_samples))
         else:
             # Closing — use release time
-            step = -1.0 / self._release_samples
-            ramp_samples = min(len(float_data), int((self._gain - target_gain) / abs(step)))
+            ramp_samples = min(n, int((self._gain - target_gain) * self._release_samples))
+        
+        if n > len(self._scratch_f32):
+            self._allocate_buffers(n)
+        scratch = self._scratch_f32[:n]
+        result = self._scratch_i16[:n]
+        
+        if noise_gate_numba.AVAILABLE:
+            # Fused envelope, multiply and int16 cast in a single compiled loop
+            start_gain = self._gain
+            if not (ramp_samples > 0 and abs(target_gain - self._gain) > 0.001):
+                start_gain = target_gain
+            self._gain = target_gain
+            return noise_gate_numba.apply_gain_ramp(audio_data, start_gain, target_gain, result)
         
         if ramp_samples > 0 and abs(target_gain - self._gain) > 0.001:
-            # Create gain envelope
-            gains = np.linspace(self._gain, target_gain, len(float_data))
-            result = (float_data * gains).astype(np.int16)
+            # Build the gain envelope in place (same points as np.linspace(gain, target, n))
+            step = (target_gain - self._gain) / max(1, n - 1)
+            np.multiply(self._ramp_base[:n], np.float32(step), out=scratch)
+            np.add(scratch, np.float32(self._gain), out=scratch)
+            np.multiply(audio_data, scratch, out=scratch)
             self._gain = target_gain
         else:
             # Constant gain
             self._gain = target_gain
-            result = (float_data * self._gain).astype(np.int16)
+            np.multiply(audio_data, np.float32(self._gain), out=scratch)
         
+        # Truncating cast back to int16, written into the reusable output buffer
+        np.copyto(result, scratch, casting='unsafe')
         return result
@@ -0,0 +1,43 @@
+"""
+Noise Gate Kernels
+Optional Numba-compiled inner loops for the noise gate.
+Install numba to enable them; NoiseGate falls back to NumPy otherwise.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+AVAILABLE = njit is not None
+
+
+if AVAILABLE:
+    @njit(cache=True, fastmath=True, boundscheck=False)
+    def sum_of_squares(x):
+        """Sum of squared int16 samples, accumulated in int64."""
+        acc = 0
+        for i in range(x.shape[0]):
+            v = np.int64(x[i])
+            acc += v * v
+        return acc
+
+    @njit(cache=True, fastmath=True, boundscheck=False)
+    def apply_gain_ramp(x, start_gain, target_gain, out):
+        """
+        Multiply samples by a linear gain ramp and truncate to int16 in one pass.
+
+        The ramp runs from start_gain at the first sample to target_gain at the
+        last (same points as np.linspace).
+        """
+        n = x.shape[0]
+        step = (target_gain - start_gain) / max(1, n - 1)
+        for i in range(n):
+            out[i] = np.int16(x[i] * (start_gain + step * i))
+        return out
+else:
+    sum_of_squares = None
+    apply_gain_ramp = None
@@ -3,8 +3,10 @@ Silence Detector Module
 Detects silence in audio streams using RMS level analysis.
 """
 
+import math
+
 import numpy as np
-from typing import Tuple
+from typing import Optional, Tuple
 
 
 class SilenceDetector:
@@ -22,7 +24,7 @@ class SilenceDetector:
             silence_duration_threshold: Seconds of continuous silence before warning.
             sample_rate: Sample rate of the audio stream.
         """
-        self.silence_threshold_db = silence_threshold_db
+        self.silence_threshold_db = silence_threshold_db  # also sets _rms_threshold
         self.silence_duration_threshold = silence_duration_threshold
         self.sample_rate = sample_rate
         
@@ -31,6 +33,17 @@ class SilenceDetector:
         self._is_silent: bool = False
         self._silence_duration: float = 0.0
     
+    @property
+    def silence_threshold_db(self) -> float:
+        """Silence threshold in dB."""
+        return self._silence_threshold_db
+    
+    @silence_threshold_db.setter
+    def silence_threshold_db(self, value: float) -> None:
+        self._silence_threshold_db = value
+        # Same threshold as a linear RMS value, so chunks compare without a log10
+        self._rms_threshold = (10.0 ** (value / 20.0)) * 32768.0
+    
     def reset(self) -> None:
         """Reset the silence detector state."""
         self._silence_start_time = 0.0
@@ -43,18 +56,20 @@ class SilenceDetector:
         Calculate the RMS (Root Mean Square) of audio data.
         
         Args:
-            audio_data: Audio samples as numpy array.
+            audio_data: Audio samples as numpy array (ideally contiguous;
+                strided views are copied to keep NumPy on its SIMD kernels).
             
         Returns:
             RMS value.
         """
         if len(audio_data) == 0:
             return 0.0
+        if not audio_data.flags.c_contiguous:
+            audio_data = np.ascontiguousarray(audio_data)
         
-        # Convert to float32 for calculation
-        data = audio_data.astype(np.float32)
-        rms = np.sqrt(np.mean(np.square(data)))
-        return rms
+        # Sum of squares as a single int64 dot product (no float32 or squared temporaries)
+        samples = audio_data.astype(np.int64, copy=False)
+        return math.sqrt(int(np.dot(samples, samples)) / len(audio_data))
     
     def rms_to_db(self, rms: float, reference: float = 32768.0) -> float:
         """
@@ -70,30 +85,33 @@ class SilenceDetector:
         if rms <= 0:
             return -100.0  # Return very low dB for silence
         
-        db = 20 * np.log10(rms / reference)
+        db = 20 * math.log10(rms / reference)
         return db
     
-    def process_chunk(self, audio_data: np.ndarray, chunk_samples: int) -> Tuple[float, bool, float]:
+    def process_chunk(self, audio_data: np.ndarray, chunk_samples: int,
+                      need_db: bool = True) -> Tuple[Optional[float], bool, float]:
         """
         Process an audio chunk and detect silence.
         
         Args:
             audio_data: Audio samples as numpy array.
             chunk_samples: Number of samples in this chunk.
+            need_db: Whether to compute the dB level for the result.
             
         Returns:
             Tuple of (db_level, is_warning_active, silence_duration_seconds).
+            db_level is None when need_db is False.
         """
         # Calculate current level
         rms = self.calculate_rms(audio_data)
-        db_level = self.rms_to_db(rms)
+        db_level = self.rms_to_db(rms) if need_db else None
         
         # Update timing
         current_time = self._total_samples_processed / self.sample_rate
         self._total_samples_processed += chunk_samples
         
         # Check if current chunk is silent
-        is_current_silent = db_level < self.silence_threshold_db
+        is_current_silent = rms < self._rms_threshold
         
         if is_current_silent:
             if not self._is_silent:
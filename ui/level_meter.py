@@ -3,9 +3,11 @@ Level Meter Widget
 Custom PyQt6 widget for displaying real-time audio levels.
 """
 
+from typing import Optional
+
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel
 from PyQt6.QtCore import Qt, QTimer, pyqtSlot
-from PyQt6.QtGui import QPainter, QColor, QLinearGradient, QPen
+from PyQt6.QtGui import QPainter, QColor, QLinearGradient, QPen, QPixmap
 
 
 class LevelMeter(QWidget):
@@ -19,6 +21,7 @@ class LevelMeter(QWidget):
         # Level configuration (in dB)
         self.min_db = -60.0
         self.max_db = 0.0
+        self._db_scale = 1.0 / (self.max_db - self.min_db)  # update if min/max change
         self.warning_db = -12.0
         self.danger_db = -6.0
         
@@ -27,6 +30,13 @@ class LevelMeter(QWidget):
         self._peak_level = self.min_db
         self._display_level = self.min_db
         
+        # Latest level from set_level, consumed by the animation timer
+        self._pending_level: Optional[float] = None
+        
+        # Levels drawn by the last paint (None until first paint)
+        self._painted_display: Optional[float] = None
+        self._painted_peak: Optional[float] = None
+        
         # Animation
         self._decay_rate = 0.3  # How much the level drops per update
         self._peak_hold_time = 1000  # ms to hold peak
@@ -42,30 +52,40 @@ class LevelMeter(QWidget):
         self.border_color = QColor(60, 60, 70)
         self.peak_color = QColor(255, 255, 255)
         
-        # Smooth animation timer
+        # Level bar gradient, rebuilt only when the widget is resized
+        self._gradient: Optional[QLinearGradient] = None
+        
+        # Pre-rendered static layers: background + border, and scale markers
+        self._bg_pixmap: Optional[QPixmap] = None
+        self._scale_pixmap: Optional[QPixmap] = None
+        
+        # Scale marker positions (dB values and their x-coordinates)
+        self._tick_dbs = [-48, -36, -24, -12, -6, 0]
+        self._tick_xs: list = []
+        self._update_tick_positions()
+        
+        # Smooth animation timer (runs only while the meter is shown)
         self._animation_timer = QTimer(self)
+        self._animation_timer.setInterval(16)  # ~60 FPS
         self._animation_timer.timeout.connect(self._animate)
-        self._animation_timer.start(16)  # ~60 FPS
     
     def _db_to_fraction(self, db: float) -> float:
         """Convert dB level to fraction (0.0 to 1.0)."""
         db = max(self.min_db, min(self.max_db, db))
-        return (db - self.min_db) / (self.max_db - self.min_db)
+        return (db - self.min_db) * self._db_scale
     
     @pyqtSlot(float)
     def set_level(self, db_level: float) -> None:
         """
         Set the current audio level.
         
+        Only the most recent level is kept; it is applied on the next
+        animation tick, so calls faster than the frame rate are coalesced.
+        
         Args:
             db_level: Level in decibels.
         """
-        self._current_level = max(self.min_db, min(self.max_db, db_level))
-        
-        # Update peak
-        if self._current_level > self._peak_level:
-            self._peak_level = self._current_level
-            self._peak_timer.start(self._peak_hold_time)
+        self._pending_level = db_level
     
     def _reset_peak(self) -> None:
         """Reset the peak hold indicator."""
@@ -74,6 +94,17 @@ class LevelMeter(QWidget):
     
     def _animate(self) -> None:
         """Animate the level display for smooth movement."""
+        # Apply the latest level reported since the last tick
+        level = self._pending_level
+        if level is not None:
+            self._pending_level = None
+            self._current_level = max(self.min_db, min(self.max_db, level))
+            
+            # Update peak
+            if self._current_level > self._peak_level:
+                self._peak_level = self._current_level
+                self._peak_timer.start(self._peak_hold_time)
+        
         # Smoothly move toward current level
         diff = self._current_level - self._display_level
         
@@ -86,10 +117,80 @@ class LevelMeter(QWidget):
             # Falling - slower decay
             self._display_level += diff * 0.15
         
-        self.update()
+        # Only repaint when the bar or peak marker has visibly moved
+        if (self._painted_display is None
+                or abs(self._display_level - self._painted_display) >= 0.1
+                or abs(self._peak_level - self._painted_peak) >= 0.1):
+            self.update()
+    
+    def _update_tick_positions(self) -> None:
+        """Recompute scale marker x-positions for the current width."""
+        padding = 4
+        bar_width = self.width() - (padding * 2)
+        self._tick_xs = [padding + int(bar_width * self._db_to_fraction(db))
+                         for db in self._tick_dbs]
+    
+    def showEvent(self, event) -> None:
+        """Resume animating when the meter becomes visible."""
+        self._animation_timer.start()
+        super().showEvent(event)
+    
+    def hideEvent(self, event) -> None:
+        """Stop animating while the meter is hidden."""
+        self._animation_timer.stop()
+        super().hideEvent(event)
+    
+    def resizeEvent(self, event) -> None:
+        """Invalidate size-dependent paint caches."""
+        self._gradient = None
+        self._bg_pixmap = None
+        self._scale_pixmap = None
+        self._update_tick_positions()
+        super().resizeEvent(event)
+    
+    def _new_layer(self) -> QPixmap:
+        """Create a transparent pixmap matching the widget size and pixel ratio."""
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(self.size() * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        return pixmap
+    
+    def _build_static_layers(self) -> None:
+        """Render the size-dependent background and scale markers once."""
+        w = self.width()
+        h = self.height()
+        padding = 4
+        
+        self._bg_pixmap = self._new_layer()
+        painter = QPainter(self._bg_pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        # Draw background
+        painter.fillRect(0, 0, w, h, self.bg_color)
+        
+        # Draw border
+        painter.setPen(QPen(self.border_color, 1))
+        painter.drawRect(0, 0, w - 1, h - 1)
+        painter.end()
+        
+        # Scale markers sit on top of the level bar, so they get their own layer
+        self._scale_pixmap = self._new_layer()
+        painter = QPainter(self._scale_pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(QPen(QColor(100, 100, 110), 1))
+        for x in self._tick_xs:
+            painter.drawLine(x, h - padding - 3, x, h - padding)
+        painter.end()
     
     def paintEvent(self, event) -> None:
         """Paint the level meter."""
+        self._painted_display = self._display_level
+        self._painted_peak = self._peak_level
+        
+        if self._bg_pixmap is None:
+            self._build_static_layers()
+        
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
@@ -100,40 +201,35 @@ class LevelMeter(QWidget):
         bar_height = h - (padding * 2)
         bar_width = w - (padding * 2)
         
-        # Draw background
-        painter.fillRect(0, 0, w, h, self.bg_color)
+        # Draw background and border
+        painter.drawPixmap(0, 0, self._bg_pixmap)
         
-        # Draw border
-        painter.setPen(QPen(self.border_color, 1))
-        painter.drawRect(0, 0, w - 1, h - 1)
-        
-        # Calculate level width
-        level_fraction = self._db_to_fraction(self._display_level)
+        # Calculate level width (display and peak levels are already clamped)
+        level_fraction = (self._display_level - self.min_db) * self._db_scale
         level_width = int(bar_width * level_fraction)
         
         if level_width > 0:
-            # Create gradient for level bar
-            gradient = QLinearGradient(padding, 0, padding + bar_width, 0)
-            gradient.setColorAt(0.0, QColor(0, 200, 100))      # Green
-            gradient.setColorAt(0.6, QColor(100, 200, 50))     # Light green
-            gradient.setColorAt(0.8, QColor(255, 200, 0))      # Yellow
-            gradient.setColorAt(0.95, QColor(255, 80, 0))      # Orange
-            gradient.setColorAt(1.0, QColor(255, 0, 0))        # Red
+            if self._gradient is None:
+                # Create gradient for level bar
+                gradient = QLinearGradient(padding, 0, padding + bar_width, 0)
+                gradient.setColorAt(0.0, QColor(0, 200, 100))      # Green
+                gradient.setColorAt(0.6, QColor(100, 200, 50))     # Light green
+                gradient.setColorAt(0.8, QColor(255, 200, 0))      # Yellow
+                gradient.setColorAt(0.95, QColor(255, 80, 0))      # Orange
+                gradient.setColorAt(1.0, QColor(255, 0, 0))        # Red
+                self._gradient = gradient
             
-            painter.fillRect(padding, padding, level_width, bar_height, gradient)
+            painter.fillRect(padding, padding, level_width, bar_height, self._gradient)
         
         # Draw peak indicator
-        peak_fraction = self._db_to_fraction(self._peak_level)
+        peak_fraction = (self._peak_level - self.min_db) * self._db_scale
         if peak_fraction > 0.01:
             peak_x = padding + int(bar_width * peak_fraction)
             painter.setPen(QPen(self.peak_color, 2))
             painter.drawLine(peak_x, padding, peak_x, padding + bar_height)
         
         # Draw scale markers
-        painter.setPen(QPen(QColor(100, 100, 110), 1))
-        for db in [-48, -36, -24, -12, -6, 0]:
-            x = padding + int(bar_width * self._db_to_fraction(db))
-            painter.drawLine(x, h - padding - 3, x, h - padding)
+        painter.drawPixmap(0, 0, self._scale_pixmap)
         
         painter.end()
 
@@ -162,14 +258,15 @@ class LevelMeterWidget(QWidget):
         self.db_label.setStyleSheet("color: #888; font-size: 10px;")
         self.db_label.setAlignment(Qt.AlignmentFlag.AlignRight)
         layout.addWidget(self.db_label)
+        self._last_db_text = self.db_label.text()
     
     @pyqtSlot(float)
     def set_level(self, db_level: float) -> None:
         """Set the audio level."""
         self.meter.set_level(db_level)
         
-        # Update dB label
-        if db_level <= -60:
-            self.db_label.setText("-∞ dB")
-        else:
-            self.db_label.setText(f"{db_level:.1f} dB")
+        # Update dB label (only when the shown text actually changes)
+        text = "-∞ dB" if db_level <= -60 else f"{db_level:.1f} dB"
+        if text != self._last_db_text:
+            self.db_label.setText(text)
+            self._last_db_text = text
@@ -4,8 +4,13 @@ Primary application window with recording controls and visualization.
 """
 
 import os
-from datetime import datetime
-from typing import Optional
+import shutil
+import textwrap
+import time
+from collections import deque
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Deque, Dict, List, Optional, Tuple
 
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
@@ -14,9 +19,11 @@ from PyQt6.QtWidgets import (
     QSystemTrayIcon, QMenu, QSlider
 )
 
-import subprocess
-from PyQt6.QtCore import Qt, QTimer, pyqtSlot, pyqtSignal, QObject, QSettings, QByteArray
-from PyQt6.QtGui import QFont, QIcon, QAction
+from PyQt6.QtCore import (
+    Qt, QTimer, pyqtSlot, pyqtSignal, QObject, QSettings, QByteArray, QThreadPool, QProcess,
+    QFileSystemWatcher
+)
+from PyQt6.QtGui import QFont, QIcon, QAction, QPixmap, QPainter, QColor
 
 from hotkey_manager import HotkeyManager
 
@@ -29,11 +36,404 @@ from ui.toast import ToastManager
 from ui.recording_history import RecordingHistoryWidget
 
 
+# Palette-independent QSS: geometry, typography and fixed colors
+# (dedented once here so Qt's parser doesn't wade through source indentation)
+_STATIC_QSS = textwrap.dedent("""
+        QWidget {
+            font-family: ".AppleSystemUIFont", "Inter", "Helvetica Neue", sans-serif;
+            font-size: 13px;
+        }
+        
+        QFrame#cardFrame, QFrame#controlsFrame {
+            border-radius: 12px;
+        }
+        
+        QLabel#sectionTitle {
+            font-size: 11px;
+            font-weight: 700;
+            letter-spacing: 0.5px;
+        }
+        
+        QLabel#helperLabel {
+            font-size: 12px;
+            margin-bottom: 2px;
+        }
+        
+        QComboBox, QPushButton {
+            border-radius: 6px;
+        }
+        
+        QComboBox {
+            padding: 8px 12px;
+            min-height: 20px;
+        }
+        
+        QComboBox::drop-down {
+            border: none;
+            width: 24px;
+        }
+        
+        QComboBox QAbstractItemView {
+            outline: none;
+            padding: 4px;
+        }
+        
+        QPushButton {
+            padding: 8px 16px;
+            font-weight: 500;
+        }
+        
+        /* Shared bases for the filled and flat button variants */
+        QPushButton#recordBtn, QPushButton#pauseBtn {
+            border: none;
+            color: white;
+            font-weight: 600;
+        }
+        
+        QPushButton#stopBtn, QPushButton#iconBtn,
+        QPushButton#ghostBtn, QPushButton#revealBtn {
+            background-color: transparent;
+        }
+        
+        QPushButton#iconBtn, QPushButton#ghostBtn {
+            border: none;
+        }
+        
+        QPushButton#recordBtn {
+            font-size: 14px;
+        }
+        
+        QPushButton#pauseBtn {
+            background-color: #f59e0b;
+            font-size: 13px;
+        }
+        
+        QPushButton#pauseBtn:hover {
+            background-color: #d97706;
+        }
+        
+        QPushButton#stopBtn:enabled:hover {
+             background-color: rgba(225, 29, 72, 0.1);
+        }
+        
+        QPushButton#iconBtn {
+            font-size: 18px;
+        }
+        
+        QPushButton#iconBtn:hover {
+            border-radius: 6px;
+        }
+        
+        QPushButton#ghostBtn {
+            text-align: right;
+            padding: 4px;
+        }
+        
+        QPushButton#ghostBtn:hover {
+            text-decoration: underline;
+        }
+        
+        QPushButton#revealBtn {
+            padding: 2px 8px;
+            font-size: 12px;
+        }
+        
+        QCheckBox {
+            spacing: 8px;
+            font-weight: 500;
+        }
+        
+        QCheckBox::indicator {
+            width: 18px;
+            height: 18px;
+            border-radius: 4px;
+            background: transparent;
+        }
+         
+        QScrollBar:vertical {
+             border: none;
+             width: 10px;
+             margin: 0px 0px 0px 0px;
+        }
+        QScrollBar::handle:vertical {
+             min-height: 20px;
+             border-radius: 5px;
+        }
+        
+        QFrame#separator {
+            border: none;
+            height: 1px;
+        }
+        
+        QFrame#indicatorsFrame {
+            border-radius: 8px;
+            padding: 4px;
+        }
+        
+        QLabel#sliderLabel {
+            font-size: 11px;
+        }
+        
+        QSlider::groove:horizontal {
+            height: 6px;
+            border-radius: 3px;
+        }
+        
+        QSlider::handle:horizontal {
+            width: 16px;
+            height: 16px;
+            margin: -5px 0;
+            border-radius: 8px;
+        }
+        
+        QSlider::sub-page:horizontal {
+            border-radius: 3px;
+        }
+        
+        QSlider#gateThresholdSlider::handle:horizontal,
+        QSlider#gateThresholdSlider::sub-page:horizontal {
+            background: #f59e0b;
+        }
+        
+        QLabel#recDot {
+            font-size: 24px;
+        }
+        
+        QLabel#recDot[paused="true"], QLabel#durationLabel[paused="true"] {
+            color: #f59e0b;
+        }
+        
+        QLabel#gateStatus {
+            color: #64748b;
+            font-size: 11px;
+        }
+        
+        QLabel#gateStatus[state="open"] {
+            color: #22c55e;
+        }
+        
+        QLabel#gateStatus[state="closed"] {
+            color: #f59e0b;
+        }
+""")
+
+# Color rules only; %(name)s fields are filled from the palette in _build_stylesheet()
+_THEME_QSS_TEMPLATE = textwrap.dedent("""
+        QMainWindow {
+            background-color: %(bg_main)s;
+        }
+        
+        QWidget {
+            color: %(text_primary)s;
+        }
+        
+        QFrame#cardFrame, QFrame#controlsFrame {
+            background-color: %(card_bg)s;
+            border: 1px solid %(border_col)s;
+        }
+        
+        QLabel#sectionTitle, QLabel#helperLabel {
+            color: %(text_secondary)s;
+        }
+        
+        QComboBox, QPushButton {
+            background-color: %(bg_main)s;
+            color: %(text_primary)s;
+            border: 1px solid %(border_col)s;
+        }
+        
+        QComboBox:hover {
+            border-color: %(text_muted)s;
+            background-color: %(bg_main)s;
+        }
+        
+        QComboBox QAbstractItemView {
+            background-color: %(card_bg)s;
+            color: %(text_primary)s;
+            selection-background-color: %(border_col)s;
+            border: 1px solid %(border_col)s;
+        }
+        
+        QPushButton:hover {
+            background-color: %(border_col)s;
+            border-color: %(text_muted)s;
+        }
+        
+        QPushButton:pressed {
+            background-color: %(bg_main)s;
+        }
+        
+        QPushButton#recordBtn {
+            background-color: %(primary_col)s;
+        }
+        
+        QPushButton#recordBtn:hover {
+            background-color: %(primary_hover)s;
+        }
+        
+        QPushButton#pauseBtn:disabled {
+            background-color: %(border_col)s;
+            color: %(text_muted)s;
+        }
+        
+        QPushButton#stopBtn, QPushButton#revealBtn {
+            border: 1px solid %(border_col)s;
+        }
+        
+        QPushButton#stopBtn, QPushButton#iconBtn {
+            color: %(text_secondary)s;
+        }
+        
+        QPushButton#stopBtn:enabled {
+             border: 1px solid %(primary_col)s;
+             color: %(primary_col)s;
+        }
+        
+        QPushButton#iconBtn:hover, QPushButton#revealBtn:hover {
+            background-color: %(border_col)s;
+        }
+        
+        QPushButton#iconBtn:hover, QPushButton#ghostBtn:hover {
+            color: %(text_primary)s;
+        }
+        
+        QPushButton#ghostBtn {
+            color: %(text_muted)s;
+        }
+        
+        QCheckBox {
+            color: %(text_primary)s;
+        }
+        
+        QCheckBox::indicator {
+            border: 2px solid %(text_muted)s;
+        }
+        
+        QCheckBox::indicator:checked {
+            background-color: %(accent_col)s;
+            border-color: %(accent_col)s;
+        }
+        
+        QScrollBar:vertical {
+             background: %(bg_main)s;
+        }
+        QScrollBar::handle:vertical {
+             background: %(border_col)s;
+        }
+        
+        QFrame#separator {
+            background-color: %(border_col)s;
+        }
+        
+        QFrame#indicatorsFrame {
+            background-color: %(bg_main)s;
+        }
+        
+        QLabel#sliderLabel {
+            color: %(text_secondary)s;
+        }
+        
+        QSlider::groove:horizontal {
+            background: %(border_col)s;
+        }
+        
+        QSlider#micVolumeSlider::handle:horizontal,
+        QSlider#micVolumeSlider::sub-page:horizontal {
+            background: %(accent_col)s;
+        }
+        
+        QLabel#recDot {
+            color: %(primary_col)s;
+        }
+""")
+
+
+# Read-only so the palette can't drift from the stylesheet built from it
+_DARK_PALETTE = MappingProxyType({
+    "bg_main": "#020617",
+    "card_bg": "#0f172a",
+    "border_col": "#1e293b",
+    "text_primary": "#f8fafc",
+    "text_secondary": "#94a3b8",
+    "text_muted": "#64748b",
+    "primary_col": "#e11d48",
+    "primary_hover": "#be123c",
+    "accent_col": "#3b82f6",
+})
+
+
+@lru_cache(maxsize=4)
+def _build_stylesheet(bg_main: str, card_bg: str, border_col: str,
+                      text_primary: str, text_secondary: str, text_muted: str,
+                      primary_col: str, primary_hover: str, accent_col: str) -> str:
+    """Build the application stylesheet for a palette (memoized per palette)."""
+    return _STATIC_QSS + _THEME_QSS_TEMPLATE % dict(
+        bg_main=bg_main,
+        card_bg=card_bg,
+        border_col=border_col,
+        text_primary=text_primary,
+        text_secondary=text_secondary,
+        text_muted=text_muted,
+        primary_col=primary_col,
+        primary_hover=primary_hover,
+        accent_col=accent_col,
+    )
+
+
+# Built once at import; the palette is fixed, so the QSS is a constant
+_STYLESHEET = _build_stylesheet(**_DARK_PALETTE)
+
+# ffmpeg arguments for merging a screen capture with its audio. Placeholders
+# ({video}, {audio}, {output}) are filled in per merge.
+_FFMPEG_MERGE_INPUTS = (
+    '-y',
+    '-nostdin',  # Never wait on the QProcess stdin pipe
+    '-fflags', '+genpts',  # Fill in any timestamps the capture lacks
+    '-i', '{video}',
+    '-i', '{audio}',
+    '-map', '0:v:0',
+    '-map', '1:a:0',
+)
+_FFMPEG_MERGE_OUTPUT = (
+    '-threads', '0',
+    '-c:a', 'aac',  # Recordings are MP3, which is cheap to transcode
+    '-b:a', '128k',
+    '-shortest',
+    '-movflags', '+faststart',
+    '-loglevel', 'error',
+    '-nostats',
+    '-progress', 'pipe:1',
+    '{output}',
+)
+# The capture is already compressed, so it is normally copied as is
+_FFMPEG_REMUX_ARGS = _FFMPEG_MERGE_INPUTS + ('-c:v', 'copy') + _FFMPEG_MERGE_OUTPUT
+# Fallback re-encode, throughput over size: no B-frames, one reference frame
+_FFMPEG_REENCODE_ARGS = _FFMPEG_MERGE_INPUTS + (
+    '-c:v', 'libx264',
+    '-preset', 'ultrafast',
+    '-tune', 'fastdecode',
+    '-bf', '0',
+    '-refs', '1',
+    '-crf', '28',
+) + _FFMPEG_MERGE_OUTPUT
+
+
 class SignalBridge(QObject):
     """Bridge for thread-safe signal emission from audio engine."""
-    level_changed = pyqtSignal(float, float)
-    silence_changed = pyqtSignal(bool, float, bool, float)
     error_occurred = pyqtSignal(str)
+    sources_scanned = pyqtSignal(list, list)
+    history_scanned = pyqtSignal(str, list)
+    recording_saved = pyqtSignal(str, object)  # Path, os.stat_result or None
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        
+        # Meter/silence readings from the audio thread. Written with deque
+        # appends and drained with popleft (both atomic under the GIL, no
+        # lock or emit) by the UI timer, so high-rate audio callbacks don't
+        # flood the event queue. pending_silence holds only the latest one.
+        self.levels: Deque[Tuple[float, float]] = deque(maxlen=64)
+        self.pending_silence: Deque[tuple] = deque(maxlen=1)
 
 
 class MainWindow(QMainWindow):
@@ -42,50 +442,65 @@ class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         
-        # Initialize audio engine
+        # Audio engine (PortAudio is initialized in _deferred_init)
         self.audio_engine = AudioEngine()
-        if not self.audio_engine.initialize():
-            QMessageBox.critical(
-                self, "Error", 
-                "Failed to initialize audio system.\nMake sure PortAudio is installed."
-            )
         
         # Initialize video engine
         self.video_engine = VideoEngine()
         self.is_recording_video = False
         
-        # Signal bridge for thread-safe updates
-        self.signal_bridge = SignalBridge()
+        # Signal bridge for thread-safe updates. Parented to the window so it
+        # lives on the GUI thread: worker emits are queued to it, and meter
+        # levels skip signals entirely (see SignalBridge.levels)
+        self.signal_bridge = SignalBridge(self)
         self.audio_engine.set_level_callback(self._on_level_update)
         self.audio_engine.set_silence_callback(self._on_silence_update)
         self.audio_engine.set_error_callback(self._on_error)
         
+        # Resolve ffmpeg once with a PATH lookup (no subprocess)
+        self._ffmpeg_path: Optional[str] = shutil.which("ffmpeg")
+        
+        # The saved file is stat'ed off the UI thread once a recording ends
+        self.signal_bridge.recording_saved.connect(self._on_recording_saved)
+        
         # Toast manager
         self.toast = ToastManager()
         
         # Recording state
         self.output_directory = os.path.expanduser("~/Music/BlackHole Recordings")
-        self._recording_start_time: Optional[datetime] = None
+        # Start/pause bookkeeping on the monotonic clock (immune to wall-clock changes)
+        self._recording_start_time: Optional[float] = None
         self._is_paused = False
-        self._pause_start_time: Optional[datetime] = None
+        self._pause_start_time: Optional[float] = None
         self._total_paused_seconds = 0.0
+        self._last_total_seconds = -1
+        self._last_sys_db = self._last_mic_db = float("inf")  # Forces the first update
+        self._last_silence_state = (False, False)
         
         # Hotkey Manager
         self.hotkey_manager = HotkeyManager()
-        self.hotkey_manager.toggle_recording.connect(self.toggle_recording)
-        try:
-            self.hotkey_manager.start()
-        except Exception as e:
-            print(f"Failed to start hotkey listener (Input Monitoring permission?): {e}")
+        # The listener emits from pynput's thread; queue explicitly so the
+        # toggle (which touches widgets) always runs on the GUI thread
+        self.hotkey_manager.toggle_recording.connect(
+            self.toggle_recording, Qt.ConnectionType.QueuedConnection
+        )
         
         # System Tray
         self._setup_system_tray()
         
         # Set up UI
+        self._applied_qss = ""
         self.setup_ui()
         self.setup_connections()
-        self.load_devices()
-        self.load_screens()
+        
+        # Record stays disabled until the first source scan finds a device
+        self.record_btn.setEnabled(False)
+        self._devices_by_index: Dict[int, AudioDevice] = {}
+        self._scan_pending = False
+        self.signal_bridge.sources_scanned.connect(self._on_sources_scanned)
+        
+        # Heavy init (PortAudio, device scan, hotkey listener) runs after the first paint
+        QTimer.singleShot(0, self._deferred_init)
         
         # Overlay Widget
         self.overlay = OverlayWidget()
@@ -93,12 +508,30 @@ class MainWindow(QMainWindow):
         self.overlay.pause_clicked.connect(self.toggle_pause)
         self.overlay.mic_toggled.connect(self._on_overlay_mic_toggled)
         
-        # Timer for recording duration update
-        self.duration_timer = QTimer(self)
-        self.duration_timer.timeout.connect(self.update_duration_display)
-        
-        # Load recording history
-        self.history_widget.scan_directory(self.output_directory)
+        # Single ~30 Hz ticker for all recording-time UI updates (duration,
+        # overlay, meters, silence indicators); runs only while recording
+        self._ui_tick = QTimer(self)
+        self._ui_tick.setTimerType(Qt.TimerType.CoarseTimer)
+        self._ui_tick.setInterval(33)
+        self._ui_tick.timeout.connect(self._tick_ui)
+        
+        # Recording history is listed off the UI thread and rescanned when the
+        # output folder changes (debounced: one save touches it several times).
+        # While a recording or merge is writing there, rescans wait for the
+        # save so half-written captures never show up in the list.
+        self.signal_bridge.history_scanned.connect(self._on_history_scanned)
+        self._history_rescan = QTimer(self)
+        self._history_rescan.setSingleShot(True)
+        self._history_rescan.setInterval(500)
+        self._history_rescan.timeout.connect(self._on_history_rescan_due)
+        self._history_rescan_deferred = False
+        self._history_watcher = QFileSystemWatcher(self)
+        self._history_watcher.directoryChanged.connect(self._on_output_directory_changed)
+        
+        # Output folder is created once, not on every Record press
+        self._output_dir_ready = False
+        
+        self._merge_proc: Optional[QProcess] = None  # Running merge, if any
         
         # Restore saved window geometry
         self._restore_window_state()
@@ -106,11 +539,17 @@ class MainWindow(QMainWindow):
     def _setup_system_tray(self) -> None:
         """Initialize the system tray icon."""
         self.tray_icon = QSystemTrayIcon(self)
+        
+        # Build both state icons once; toggling just swaps them
+        self._icon_black = self._make_dot_icon("#000000")
+        self._icon_red = self._make_dot_icon("#e11d48")
         self._set_tray_icon_color("black")
         
         self.tray_menu = QMenu()
         
-        self.tray_action_toggle = QAction("Start Recording", self)
+        # Static text: the icon color shows the state, so toggling never relayouts the menu
+        self.tray_action_toggle = QAction("Toggle Recording", self)
+        self.tray_action_toggle.setToolTip("Start or stop recording")
         self.tray_action_toggle.triggered.connect(self.toggle_recording)
         self.tray_menu.addAction(self.tray_action_toggle)
         
@@ -121,7 +560,7 @@ class MainWindow(QMainWindow):
         self.tray_menu.addSeparator()
         
         self.tray_action_quit = QAction("Quit", self)
-        self.tray_action_quit.triggered.connect(QApplication.instance().quit)
+        self.tray_action_quit.triggered.connect(self._quit_from_tray)
         self.tray_menu.addAction(self.tray_action_quit)
         
         self.tray_icon.setContextMenu(self.tray_menu)
@@ -133,25 +572,35 @@ class MainWindow(QMainWindow):
         self.raise_()
         self.activateWindow()
 
-    def _set_tray_icon_color(self, color: str) -> None:
-        """Set tray icon color using a generated Pixmap."""
-        from PyQt6.QtGui import QPixmap, QPainter, QColor
-        pixmap = QPixmap(22, 22)
-        pixmap.fill(Qt.GlobalColor.transparent)
-        
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    @staticmethod
+    def _make_dot_icon(color: str) -> QIcon:
+        """
+        Create a tray icon showing a filled dot of the given color.
         
-        if color == "red":
-             painter.setBrush(QColor("#e11d48"))
-        else:
-             painter.setBrush(QColor("#000000"))
-             
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.drawEllipse(4, 4, 14, 14)
-        painter.end()
+        The dot is painted once at 1x and 2x so Retina menu bars get a sharp
+        pixmap instead of an upscaled one; switching icons never repaints.
+        """
+        icon = QIcon()
+        for scale in (1, 2):
+            pixmap = QPixmap(22 * scale, 22 * scale)
+            pixmap.setDevicePixelRatio(scale)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            
+            # Coordinates are logical; the device pixel ratio scales them
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setBrush(QColor(color))
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.drawEllipse(4, 4, 14, 14)
+            painter.end()
+            
+            icon.addPixmap(pixmap)
         
-        self.tray_icon.setIcon(QIcon(pixmap))
+        return icon
+
+    def _set_tray_icon_color(self, color: str) -> None:
+        """Set tray icon color ("red" while recording, black otherwise)."""
+        self.tray_icon.setIcon(self._icon_red if color == "red" else self._icon_black)
 
     def toggle_recording(self) -> None:
         """Toggle recording state (Start/Stop)."""
@@ -159,7 +608,7 @@ class MainWindow(QMainWindow):
             self.stop_recording()
         elif self.audio_engine.state == RecordingState.PAUSED:
             self.stop_recording()
-        else:
+        elif self._merge_proc is None:  # No new recording until the last one is merged
             self.start_recording()
             
     def setup_ui(self) -> None:
@@ -176,8 +625,9 @@ class MainWindow(QMainWindow):
         layout.setContentsMargins(20, 20, 20, 20)
         layout.setSpacing(16)
         
-        # Apply dark theme
-        self.setStyleSheet(self._get_stylesheet())
+        # Apply dark theme (the only stylesheet set in this window; children
+        # are styled through objectName selectors in it)
+        self._apply_stylesheet(_STYLESHEET)
         
         # === Header ===
         header_container = QWidget()
@@ -190,7 +640,6 @@ class MainWindow(QMainWindow):
         
         header_text = QLabel("BlackHole Audio Recorder")
         header_text.setFont(QFont(".AppleSystemUIFont", 20, QFont.Weight.Bold))
-        header_text.setStyleSheet("color: #f8fafc;")
         header_layout.addWidget(header_text)
         header_layout.addStretch()
         
@@ -230,7 +679,7 @@ class MainWindow(QMainWindow):
         # Separator
         line = QFrame()
         line.setFrameShape(QFrame.Shape.HLine)
-        line.setStyleSheet("background-color: #1e293b; border: none; height: 1px;")
+        line.setObjectName("separator")
         sources_layout.addWidget(line)
         
         # Microphone Input
@@ -254,37 +703,26 @@ class MainWindow(QMainWindow):
         mic_vol_row = QHBoxLayout()
         mic_vol_row.setSpacing(8)
         mic_vol_label = QLabel("Mic Volume")
-        mic_vol_label.setStyleSheet("color: #94a3b8; font-size: 11px;")
+        mic_vol_label.setObjectName("sliderLabel")
         mic_vol_row.addWidget(mic_vol_label)
         
         self.mic_volume_slider = QSlider(Qt.Orientation.Horizontal)
         self.mic_volume_slider.setRange(0, 200)
         self.mic_volume_slider.setValue(100)
         self.mic_volume_slider.setToolTip("Mic volume: 100%")
-        self.mic_volume_slider.setStyleSheet("""
-            QSlider::groove:horizontal {
-                background: #1e293b; height: 6px; border-radius: 3px;
-            }
-            QSlider::handle:horizontal {
-                background: #3b82f6; width: 16px; height: 16px;
-                margin: -5px 0; border-radius: 8px;
-            }
-            QSlider::sub-page:horizontal {
-                background: #3b82f6; border-radius: 3px;
-            }
-        """)
+        self.mic_volume_slider.setObjectName("micVolumeSlider")
         mic_vol_row.addWidget(self.mic_volume_slider, 1)
         
         self.mic_vol_value = QLabel("100%")
         self.mic_vol_value.setFixedWidth(40)
-        self.mic_vol_value.setStyleSheet("color: #94a3b8; font-size: 11px;")
+        self.mic_vol_value.setObjectName("sliderLabel")
         mic_vol_row.addWidget(self.mic_vol_value)
         mic_row.addLayout(mic_vol_row)
         
         # Separator
         line2 = QFrame()
         line2.setFrameShape(QFrame.Shape.HLine)
-        line2.setStyleSheet("background-color: #1e293b; border: none; height: 1px;")
+        line2.setObjectName("separator")
         mic_row.addWidget(line2)
         
         # Noise Gate Controls
@@ -295,7 +733,7 @@ class MainWindow(QMainWindow):
         gate_header.addWidget(self.noise_gate_check)
         
         self.gate_status_label = QLabel("○ OFF")
-        self.gate_status_label.setStyleSheet("color: #64748b; font-size: 11px;")
+        self.gate_status_label.setObjectName("gateStatus")
         gate_header.addStretch()
         gate_header.addWidget(self.gate_status_label)
         mic_row.addLayout(gate_header)
@@ -303,7 +741,7 @@ class MainWindow(QMainWindow):
         gate_threshold_row = QHBoxLayout()
         gate_threshold_row.setSpacing(8)
         gate_thresh_label = QLabel("Threshold")
-        gate_thresh_label.setStyleSheet("color: #94a3b8; font-size: 11px;")
+        gate_thresh_label.setObjectName("sliderLabel")
         gate_threshold_row.addWidget(gate_thresh_label)
         
         self.gate_threshold_slider = QSlider(Qt.Orientation.Horizontal)
@@ -311,23 +749,12 @@ class MainWindow(QMainWindow):
         self.gate_threshold_slider.setValue(-40)
         self.gate_threshold_slider.setToolTip("Noise gate threshold: -40 dB")
         self.gate_threshold_slider.setEnabled(False)
-        self.gate_threshold_slider.setStyleSheet("""
-            QSlider::groove:horizontal {
-                background: #1e293b; height: 6px; border-radius: 3px;
-            }
-            QSlider::handle:horizontal {
-                background: #f59e0b; width: 16px; height: 16px;
-                margin: -5px 0; border-radius: 8px;
-            }
-            QSlider::sub-page:horizontal {
-                background: #f59e0b; border-radius: 3px;
-            }
-        """)
+        self.gate_threshold_slider.setObjectName("gateThresholdSlider")
         gate_threshold_row.addWidget(self.gate_threshold_slider, 1)
         
         self.gate_thresh_value = QLabel("-40 dB")
         self.gate_thresh_value.setFixedWidth(48)
-        self.gate_thresh_value.setStyleSheet("color: #94a3b8; font-size: 11px;")
+        self.gate_thresh_value.setObjectName("sliderLabel")
         gate_threshold_row.addWidget(self.gate_thresh_value)
         mic_row.addLayout(gate_threshold_row)
         
@@ -360,7 +787,7 @@ class MainWindow(QMainWindow):
         
         # Indicators
         indicators_frame = QFrame()
-        indicators_frame.setStyleSheet("background-color: #020617; border-radius: 8px; padding: 4px;")
+        indicators_frame.setObjectName("indicatorsFrame")
         indicators_layout = QHBoxLayout(indicators_frame)
         indicators_layout.setSpacing(12)
         
@@ -392,6 +819,8 @@ class MainWindow(QMainWindow):
         
         self.screen_combo = QComboBox()
         self.screen_combo.setMinimumWidth(150)
+        # Filled after the window is shown, so size to the items as they arrive
+        self.screen_combo.setSizeAdjustPolicy(QComboBox.SizeAdjustPolicy.AdjustToContents)
         options_row.addWidget(self.screen_combo)
         
         options_row.addStretch()
@@ -410,12 +839,12 @@ class MainWindow(QMainWindow):
         time_layout.setContentsMargins(0, 0, 0, 0)
         
         self.duration_label = QLabel("00:00:00")
+        self.duration_label.setObjectName("durationLabel")
         self.duration_label.setFont(QFont("Monaco", 28, QFont.Weight.Bold))
-        self.duration_label.setStyleSheet("color: #f8fafc;")
         self.duration_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
         self.rec_dot = QLabel("●")
-        self.rec_dot.setStyleSheet("color: #e11d48; font-size: 24px;")
+        self.rec_dot.setObjectName("recDot")
         self.rec_dot.setVisible(False)
         
         time_layout.addStretch()
@@ -453,10 +882,24 @@ class MainWindow(QMainWindow):
         controls_layout.addLayout(btn_layout)
         
         # Status Bar
+        status_layout = QHBoxLayout()
+        status_layout.setSpacing(8)
+        
         self.status_label = QLabel("Ready to record")
         self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.status_label.setStyleSheet("color: #64748b; font-size: 12px; font-weight: 500;")
-        controls_layout.addWidget(self.status_label)
+        status_layout.addWidget(self.status_label, 1)
+        
+        # Inline reveal action for the last saved recording (no modal dialog)
+        self.reveal_btn = QPushButton("📂 Reveal")
+        self.reveal_btn.setToolTip("Reveal in Finder")
+        self.reveal_btn.setObjectName("revealBtn")
+        self.reveal_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.reveal_btn.setVisible(False)
+        status_layout.addWidget(self.reveal_btn)
+        self._last_saved_path: Optional[str] = None
+        
+        controls_layout.addLayout(status_layout)
         
         layout.addWidget(controls_frame)
         
@@ -476,17 +919,22 @@ class MainWindow(QMainWindow):
         self.output_label = QLabel()
         
         # Connect signal bridge
-        self.signal_bridge.level_changed.connect(self._update_levels)
-        self.signal_bridge.silence_changed.connect(self._update_silence_indicators)
         self.signal_bridge.error_occurred.connect(self._show_error)
     
+    def _apply_stylesheet(self, qss: str) -> None:
+        """Set the window stylesheet, skipping Qt's re-polish if it is unchanged."""
+        if qss == self._applied_qss:
+            return
+        self._applied_qss = qss
+        self.setStyleSheet(qss)
+    
     def setup_connections(self) -> None:
         """Set up signal-slot connections."""
         self.record_btn.clicked.connect(self.start_recording)
         self.stop_btn.clicked.connect(self.stop_recording)
         self.pause_btn.clicked.connect(self.toggle_pause)
-        self.refresh_btn.clicked.connect(self.load_devices)
-        self.refresh_btn.clicked.connect(self.load_screens)
+        self.refresh_btn.clicked.connect(self._refresh_sources)
+        self.reveal_btn.clicked.connect(self._on_reveal_clicked)
         self.change_output_btn.clicked.connect(self.change_output_directory)
         self.mic_check.toggled.connect(self._toggle_mic_selection)
         self.screen_record_check.toggled.connect(self._toggle_screen_selection)
@@ -497,9 +945,9 @@ class MainWindow(QMainWindow):
     def _toggle_mic_selection(self, checked: bool) -> None:
         """Enable/disable mic selection and dynamically toggle during recording."""
         if self.audio_engine.state in (RecordingState.RECORDING, RecordingState.PAUSED):
-            if checked and self.mic_combo.currentData():
-                mic_device: AudioDevice = self.mic_combo.currentData()
-                self.audio_engine.enable_mic(mic_device.index)
+            mic_index = self.mic_combo.currentData()
+            if checked and mic_index is not None:
+                self.audio_engine.enable_mic(mic_index)
                 self.toast.info("Microphone enabled")
             else:
                 self.audio_engine.disable_mic()
@@ -526,12 +974,10 @@ class MainWindow(QMainWindow):
         self.audio_engine.noise_gate_enabled = checked
         self.gate_threshold_slider.setEnabled(checked)
         if checked:
-            self.gate_status_label.setText("● ACTIVE")
-            self.gate_status_label.setStyleSheet("color: #22c55e; font-size: 11px;")
+            self._set_gate_status("● ACTIVE", "open")
             self.toast.info("Noise gate enabled")
         else:
-            self.gate_status_label.setText("○ OFF")
-            self.gate_status_label.setStyleSheet("color: #64748b; font-size: 11px;")
+            self._set_gate_status("○ OFF", "off")
     
     def _on_gate_threshold_changed(self, value: int) -> None:
         """Handle noise gate threshold slider change."""
@@ -543,73 +989,191 @@ class MainWindow(QMainWindow):
         """Handle mic toggle from overlay — sync with main window checkbox."""
         self.mic_check.setChecked(active)
     
-    def load_screens(self) -> None:
-        """Load available screens/monitors."""
-        self.screen_combo.clear()
-        monitors = self.video_engine.get_monitors()
+    def _deferred_init(self) -> None:
+        """Initialize audio, start the source scan and hotkeys once the window is up."""
+        if not self.audio_engine.initialize():
+            QMessageBox.critical(
+                self, "Error", 
+                "Failed to initialize audio system.\nMake sure PortAudio is installed."
+            )
         
-        for i, m in enumerate(monitors):
-            name = f"Monitor {i+1} ({m['width']}x{m['height']})"
-            self.screen_combo.addItem(name, i)
+        # Enumerate devices/screens and past recordings off the UI thread
+        self._refresh_sources()
+        self._ensure_output_directory()
+        self._refresh_history()
+        
+        try:
+            self.hotkey_manager.start()
+        except Exception as e:
+            print(f"Failed to start hotkey listener (Input Monitoring permission?): {e}")
+    
+    def _refresh_sources(self) -> None:
+        """Re-enumerate audio devices and screens on a worker thread."""
+        if self._scan_pending:
+            return
+        self._scan_pending = True
+        QThreadPool.globalInstance().start(self._scan_sources)
+    
+    def _scan_sources(self) -> None:
+        """Enumerate devices and monitors (thread pool) and hand them to the UI thread."""
+        # Always report back, even empty-handed: the UI thread waits on this
+        # to clear _scan_pending and enable recording
+        devices: List[AudioDevice] = []
+        monitors: List[dict] = []
+        try:
+            devices = self.audio_engine.get_input_devices()
+        except Exception as e:
+            self.signal_bridge.error_occurred.emit(f"Could not list audio devices: {e}")
+        try:
+            monitors = self.video_engine.get_monitors(refresh=True)
+        except Exception as e:
+            self.signal_bridge.error_occurred.emit(f"Could not list screens: {e}")
+        self.signal_bridge.sources_scanned.emit(devices, monitors)
+    
+    @pyqtSlot(list, list)
+    def _on_sources_scanned(self, devices: List[AudioDevice], monitors: List[dict]) -> None:
+        """Populate the source combos from a finished background scan."""
+        self._scan_pending = False
+        self.load_devices(devices)
+        self.load_screens(monitors)
+    
+    def _ensure_output_directory(self) -> None:
+        """Create the output directory (once) and start watching it."""
+        if not self._output_dir_ready:
+            os.makedirs(self.output_directory, exist_ok=True)
+            self._output_dir_ready = True
+        self._watch_output_directory()
+    
+    def _on_output_directory_changed(self, path: str) -> None:
+        """Schedule a history rescan; notice if the folder itself was removed."""
+        if not os.path.isdir(path):
+            self._output_dir_ready = False
+        self._history_rescan.start()
+    
+    def _on_history_rescan_due(self) -> None:
+        """Rescan after folder changes, unless a capture is still being written."""
+        capturing = self.audio_engine.state in (RecordingState.RECORDING, RecordingState.PAUSED)
+        if capturing or self._merge_proc is not None:
+            self._history_rescan_deferred = True  # Picked up in _on_recording_saved
+            return
+        self._refresh_history()
+    
+    def _watch_output_directory(self) -> None:
+        """Point the history watcher at the current output directory."""
+        watched = self._history_watcher.directories()
+        if watched == [self.output_directory]:
+            return
+        if watched:
+            self._history_watcher.removePaths(watched)
+        if os.path.isdir(self.output_directory):
+            self._history_watcher.addPath(self.output_directory)
+    
+    def _refresh_history(self) -> None:
+        """Rescan the output directory for recordings on a worker thread."""
+        directory = self.output_directory
+        QThreadPool.globalInstance().start(lambda: self._scan_history(directory))
+    
+    def _scan_history(self, directory: str) -> None:
+        """List recordings (thread pool) and hand them to the UI thread."""
+        files = RecordingHistoryWidget.list_recordings(directory)
+        self.signal_bridge.history_scanned.emit(directory, files)
+    
+    @pyqtSlot(str, list)
+    def _on_history_scanned(self, directory: str, files: List[Tuple[str, os.stat_result]]) -> None:
+        """Sync the history list with a finished background scan."""
+        if directory != self.output_directory:
+            return  # Output directory changed while scanning
+        self.history_widget.set_recordings(files)
+    
+    def load_screens(self, monitors: List[dict]) -> None:
+        """Load available screens/monitors into the screen combo."""
+        names = [f"Monitor {i+1} ({m['width']}x{m['height']})" for i, m in enumerate(monitors)]
+        
+        # Fill the combo in one batch without per-item change signals
+        self.screen_combo.blockSignals(True)
+        self.screen_combo.clear()
+        self.screen_combo.addItems(names)
+        for i in range(len(names)):
+            self.screen_combo.setItemData(i, i)
+        self.screen_combo.blockSignals(False)
             
         if self.screen_combo.count() == 0:
              self.screen_combo.addItem("No Monitors Found")
              self.screen_combo.setEnabled(False)
     
-    def load_devices(self) -> None:
-        """Load available audio input devices."""
-        self.device_combo.clear()
-        self.mic_combo.clear()
+    def load_devices(self, devices: List[AudioDevice]) -> None:
+        """Load available audio input devices into the device/mic combos."""
+        self._devices_by_index = {device.index: device for device in devices}
         
-        devices = self.audio_engine.get_input_devices()
         blackhole_index = -1
+        mic_index = -1
+        names = []
         
         for i, device in enumerate(devices):
             display_name = device.name
             if device.is_blackhole:
                 display_name = f"✓ {device.name} (Recommended)"
                 blackhole_index = i
-            
-            self.device_combo.addItem(display_name, device)
-            self.mic_combo.addItem(device.name, device)
+            if mic_index < 0 and "microphone" in device.name.lower():
+                mic_index = i
+            names.append(display_name)
+        
+        # Fill both combos in one batch without per-item change signals
+        combos = (self.device_combo, self.mic_combo)
+        for combo in combos:
+            combo.blockSignals(True)
+            combo.clear()
+        
+        self.device_combo.addItems(names)
+        self.mic_combo.addItems([device.name for device in devices])
+        
+        # Item data is the plain PortAudio index; look the device up when needed
+        for i, device in enumerate(devices):
+            self.device_combo.setItemData(i, device.index)
+            self.mic_combo.setItemData(i, device.index)
         
         if blackhole_index >= 0:
             self.device_combo.setCurrentIndex(blackhole_index)
-            self.status_label.setText("BlackHole device detected — Ready to record")
-            self.status_label.setStyleSheet("color: #00cc66; font-size: 13px;")
+        if mic_index >= 0:
+            self.mic_combo.setCurrentIndex(mic_index)
+        
+        for combo in combos:
+            combo.blockSignals(False)
+        
+        if blackhole_index >= 0:
+            self._set_label(
+                self.status_label, "BlackHole device detected — Ready to record",
+                "color: #00cc66; font-size: 13px;"
+            )
         elif self.device_combo.count() == 0:
-            self.status_label.setText("No audio input devices found")
-            self.status_label.setStyleSheet("color: #ff4444; font-size: 13px;")
-            self.record_btn.setEnabled(False)
-            
-        for i in range(self.mic_combo.count()):
-            dev = self.mic_combo.itemData(i)
-            if "microphone" in dev.name.lower():
-                self.mic_combo.setCurrentIndex(i)
-                break
+            self._set_label(
+                self.status_label, "No audio input devices found",
+                "color: #ff4444; font-size: 13px;"
+            )
+        self.record_btn.setEnabled(self.device_combo.count() > 0 and self._merge_proc is None)
     
     def start_recording(self) -> None:
         """Start audio recording."""
         if self.device_combo.count() == 0:
             return
         
-        device: AudioDevice = self.device_combo.currentData()
+        device = self._devices_by_index.get(self.device_combo.currentData())
         if not device:
             return
         
-        os.makedirs(self.output_directory, exist_ok=True)
+        self._ensure_output_directory()
         
         mic_index = None
-        if self.mic_check.isChecked() and self.mic_combo.currentData():
-            mic_device: AudioDevice = self.mic_combo.currentData()
-            mic_index = mic_device.index
+        if self.mic_check.isChecked():
+            mic_index = self.mic_combo.currentData()
         
         # Check Video
         self.is_recording_video = self.screen_record_check.isChecked()
         if self.is_recording_video:
-            try:
-                subprocess.run(['ffmpeg', '-version'], capture_output=True, check=True)
-            except (subprocess.CalledProcessError, FileNotFoundError):
+            if self._ffmpeg_path is None:
+                # May have been installed since launch
+                self._ffmpeg_path = shutil.which("ffmpeg")
+            if self._ffmpeg_path is None:
                 QMessageBox.critical(
                     self, "FFmpeg Missing",
                     "Screen recording requires FFmpeg.\nInstall: brew install ffmpeg"
@@ -624,30 +1188,19 @@ class MainWindow(QMainWindow):
         success = self.audio_engine.start_recording(device.index, self.output_directory, mic_device_index=mic_index)
         
         if success:
-            self._recording_start_time = datetime.now()
+            self._recording_start_time = time.monotonic()
             self._is_paused = False
             self._total_paused_seconds = 0.0
-            self.duration_timer.start(100)
+            self._start_ui_tick()
             
             # Update UI
-            self.record_btn.setEnabled(False)
-            self.stop_btn.setEnabled(True)
-            self.pause_btn.setEnabled(True)
-            self.pause_btn.setVisible(True)
-            self.device_combo.setEnabled(False)
-            self.mic_combo.setEnabled(False)
-            self.screen_record_check.setEnabled(False)
-            self.screen_combo.setEnabled(False)
-            self.refresh_btn.setEnabled(False)
-            
-            self.status_label.setText(f"🔴 Recording from: {device.name}")
-            self.status_label.setStyleSheet("color: #ff4444; font-size: 13px;")
-            
-            self.record_btn.setText("Recording...")
-            self.rec_dot.setVisible(True)
+            self._set_recording_ui_state(True)
+            self._set_label(
+                self.status_label, f"🔴 Recording from: {device.name}",
+                "color: #ff4444; font-size: 13px;"
+            )
             
-            # Update Tray
-            self.tray_action_toggle.setText("Stop Recording")
+            # Update Tray icon
             self._set_tray_icon_color("red")
             
             # Show Overlay with mic state synced
@@ -660,40 +1213,89 @@ class MainWindow(QMainWindow):
         else:
             self.toast.error(f"Could not start recording from {device.name}")
     
+    def _set_recording_ui_state(self, recording: bool) -> None:
+        """
+        Switch the controls between the recording and idle states.
+        
+        Repaints are suspended while the widgets change so the transition
+        costs a single repaint.
+        """
+        central = self.centralWidget()
+        central.setUpdatesEnabled(False)
+        
+        idle = not recording
+        self.record_btn.setEnabled(idle)
+        self.stop_btn.setEnabled(recording)
+        self.pause_btn.setEnabled(recording)
+        self.pause_btn.setVisible(recording)
+        self.device_combo.setEnabled(idle)
+        self.mic_combo.setEnabled(idle and self.mic_check.isChecked())
+        self.screen_record_check.setEnabled(idle)
+        self.screen_combo.setEnabled(idle)
+        self.refresh_btn.setEnabled(idle)
+        if recording:
+            self.reveal_btn.setVisible(False)
+        self.record_btn.setText("Recording..." if recording else "Start Recording")
+        self.rec_dot.setVisible(recording)
+        
+        if idle:
+            self.mic_check.setEnabled(True)
+            self.pause_btn.setText("⏸ Pause")
+            self._set_paused_style(False)
+            self.sys_silence_indicator.reset()
+            self.mic_silence_indicator.reset()
+        
+        # Re-enabling updates schedules one repaint of the whole tree
+        central.setUpdatesEnabled(True)
+    
+    def _set_paused_style(self, paused: bool) -> None:
+        """Switch the rec dot and duration between the recording and paused colors."""
+        for label in (self.rec_dot, self.duration_label):
+            if label.property("paused") != paused:
+                # The window stylesheet keys off this property; re-polish to apply it
+                label.setProperty("paused", paused)
+                label.style().unpolish(label)
+                label.style().polish(label)
+    
     def toggle_pause(self) -> None:
         """Toggle pause/resume recording."""
         if self._is_paused:
             # Resume
             self.audio_engine.resume_recording()
             self._is_paused = False
-            if self._pause_start_time:
-                self._total_paused_seconds += (datetime.now() - self._pause_start_time).total_seconds()
+            if self._pause_start_time is not None:
+                self._total_paused_seconds += time.monotonic() - self._pause_start_time
                 self._pause_start_time = None
+            self._ui_tick.start()
             
             self.pause_btn.setText("⏸ Pause")
-            self.rec_dot.setStyleSheet("color: #e11d48; font-size: 24px;")
-            self.duration_label.setStyleSheet("color: #f8fafc;")
-            self.status_label.setText("🔴 Recording resumed")
-            self.status_label.setStyleSheet("color: #ff4444; font-size: 13px;")
+            self._set_paused_style(False)
+            self._set_label(
+                self.status_label, "🔴 Recording resumed",
+                "color: #ff4444; font-size: 13px;"
+            )
             self.overlay.set_paused(False)
             self.toast.info("Recording resumed")
         else:
             # Pause
             self.audio_engine.pause_recording()
             self._is_paused = True
-            self._pause_start_time = datetime.now()
+            self._pause_start_time = time.monotonic()
+            # The engine reads no audio while paused, so there is nothing to show
+            self._ui_tick.stop()
             
             self.pause_btn.setText("▶ Resume")
-            self.rec_dot.setStyleSheet("color: #f59e0b; font-size: 24px;")
-            self.duration_label.setStyleSheet("color: #f59e0b;")
-            self.status_label.setText("⏸ Recording paused")
-            self.status_label.setStyleSheet("color: #f59e0b; font-size: 13px;")
+            self._set_paused_style(True)
+            self._set_label(
+                self.status_label, "⏸ Recording paused",
+                "color: #f59e0b; font-size: 13px;"
+            )
             self.overlay.set_paused(True)
             self.toast.warning("Recording paused")
     
     def stop_recording(self) -> None:
         """Stop audio recording and save file."""
-        self.duration_timer.stop()
+        self._ui_tick.stop()
         self._is_paused = False
         self._pause_start_time = None
         
@@ -704,83 +1306,176 @@ class MainWindow(QMainWindow):
             video_path = self.video_engine.stop_recording()
         
         # Reset UI
-        self.record_btn.setEnabled(True)
-        self.stop_btn.setEnabled(False)
-        self.pause_btn.setEnabled(False)
-        self.pause_btn.setVisible(False)
-        self.pause_btn.setText("⏸ Pause")
-        self.device_combo.setEnabled(True)
-        self.mic_check.setEnabled(True)
-        self.mic_combo.setEnabled(self.mic_check.isChecked())
-        self.screen_record_check.setEnabled(True)
-        self.screen_combo.setEnabled(True)
-        self.refresh_btn.setEnabled(True)
-        
-        self.record_btn.setText("Start Recording")
-        self.rec_dot.setVisible(False)
-        self.rec_dot.setStyleSheet("color: #e11d48; font-size: 24px;")
-        self.duration_label.setStyleSheet("color: #f8fafc;")
-        self.sys_silence_indicator.reset()
-        self.mic_silence_indicator.reset()
+        self._set_recording_ui_state(False)
         
-        # Update Tray
-        self.tray_action_toggle.setText("Start Recording")
+        # Update Tray icon
         self._set_tray_icon_color("black")
         
         # Hide Overlay
         self.overlay.hide()
         
-        final_path = audio_path
-        
         if self.is_recording_video and audio_path and video_path:
-            self.status_label.setText("⏳ Merging Audio & Video...")
-            self.status_label.setStyleSheet("color: #ebcb8b; font-size: 13px;")
-            QApplication.processEvents()
-            final_path = self._merge_recordings(audio_path, video_path)
-        
-        if final_path and os.path.exists(final_path):
-            file_size = os.path.getsize(final_path) / 1024 / 1024
-            self.status_label.setText(f"✅ Saved: {os.path.basename(final_path)} ({file_size:.1f} MB)")
-            self.status_label.setStyleSheet("color: #00cc66; font-size: 13px;")
+            self._set_label(
+                self.status_label, "⏳ Merging Audio & Video...",
+                "color: #ebcb8b; font-size: 13px;"
+            )
+            # Finishes asynchronously via _finish_recording
+            self._merge_recordings(audio_path, video_path)
+        else:
+            self._finish_recording(audio_path)
+    
+    @staticmethod
+    def _stat_saved(final_path: Optional[str]) -> Optional[os.stat_result]:
+        """Stat a saved recording, or None if there is no such file."""
+        if not final_path:
+            return None
+        try:
+            # A single stat covers the existence check, the size and the
+            # history entry's metadata
+            return os.stat(final_path)
+        except OSError:
+            return None
+    
+    def _finish_recording(self, final_path: Optional[str]) -> None:
+        """
+        Report the saved recording (called once any merge has completed).
+        
+        A file that was just written can be slow to stat while Spotlight or
+        antivirus scans it, so the lookup runs on the thread pool and
+        _on_recording_saved updates the UI.
+        """
+        QThreadPool.globalInstance().start(lambda: self._stat_saved_recording(final_path))
+    
+    def _stat_saved_recording(self, final_path: Optional[str]) -> None:
+        """Stat the saved file (thread pool) and report back to the UI thread."""
+        self.signal_bridge.recording_saved.emit(final_path or "", self._stat_saved(final_path))
+    
+    @pyqtSlot(str, object)
+    def _on_recording_saved(self, final_path: str, stat_result: Optional[os.stat_result]) -> None:
+        """Show the saved recording, or the idle status if nothing was written."""
+        if stat_result is not None:
+            file_size = stat_result.st_size / 1024 / 1024
+            saved = f"Saved: {os.path.basename(final_path)} ({file_size:.1f} MB)"
+            self._set_label(
+                self.status_label, f"✅ {saved}",
+                "color: #00cc66; font-size: 13px;"
+            )
+            
+            self._last_saved_path = final_path
+            self.reveal_btn.setVisible(True)
             
             # Add to history
-            self.history_widget.add_recording(final_path)
+            self.history_widget.add_recording(final_path, stat_result)
             
             # Toast instead of blocking dialog
-            self.toast.success(f"Saved: {os.path.basename(final_path)} ({file_size:.1f} MB)")
+            self.toast.success(saved)
         else:
-            self.status_label.setText("Ready to record")
-            self.status_label.setStyleSheet("color: #888; font-size: 13px;")
-            
-    def _merge_recordings(self, audio_path: str, video_path: str) -> Optional[str]:
-        """Merge audio and video files using ffmpeg."""
-        try:
-            output_path = video_path.replace("video_temp_", "screen_recording_")
-            cmd = [
-                'ffmpeg', '-y',
-                '-i', video_path,
-                '-i', audio_path,
-                '-c:v', 'libx264',
-                '-crf', '23',
-                '-preset', 'veryfast',
-                '-c:a', 'aac',
-                '-shortest',
-                '-loglevel', 'error',
-                output_path
-            ]
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            self._set_label(self.status_label, "Ready to record", "color: #888; font-size: 13px;")
+        
+        # Catch up on folder changes held back while the capture was written
+        if self._history_rescan_deferred:
+            self._history_rescan_deferred = False
+            self._refresh_history()
+    
+    def _on_reveal_clicked(self) -> None:
+        """Reveal the last saved recording."""
+        if self._last_saved_path and os.path.exists(self._last_saved_path):
+            self._reveal_in_file_manager(self._last_saved_path)
+    
+    def _reveal_in_file_manager(self, file_path: str) -> None:
+        """Reveal a file in Finder."""
+        QProcess.startDetached("open", ["-R", file_path])
             
-            if result.returncode == 0:
+    def _merge_recordings(self, audio_path: str, video_path: str, reencode: bool = False) -> None:
+        """
+        Merge audio and video files using ffmpeg without blocking the UI.
+        
+        ffmpeg runs in a QProcess; when it exits, _finish_recording is called
+        with the merged file, or with the audio file if the merge failed.
+        Progress is read from ffmpeg's -progress output as it runs.
+        
+        The captured video is already compressed, so it is first remuxed as
+        is; only if that fails is it re-encoded with libx264.
+        """
+        output_path = video_path.replace("video_temp_", "screen_recording_")
+        # Last whole second shown by the duration display
+        duration_s = max(self._last_total_seconds, 1)
+        template = _FFMPEG_REENCODE_ARGS if reencode else _FFMPEG_REMUX_ARGS
+        args = [
+            arg.format(video=video_path, audio=audio_path, output=output_path)
+            for arg in template
+        ]
+        
+        proc = QProcess(self)
+        proc.readyReadStandardOutput.connect(
+            lambda: self._on_merge_progress(proc, duration_s)
+        )
+        proc.finished.connect(
+            lambda *_: self._on_merge_finished(proc, audio_path, video_path, output_path, reencode)
+        )
+        proc.errorOccurred.connect(
+            lambda error: self._on_merge_error(proc, error, audio_path)
+        )
+        self._merge_proc = proc
+        self.record_btn.setEnabled(False)
+        proc.start(self._ffmpeg_path or 'ffmpeg', args)
+    
+    def _on_merge_progress(self, proc: QProcess, duration_s: int) -> None:
+        """Show how far the merge has got, from ffmpeg's key=value progress lines."""
+        out_time_us = None
+        for line in bytes(proc.readAllStandardOutput()).decode(errors='replace').splitlines():
+            if line.startswith("out_time_us="):
+                value = line[len("out_time_us="):]
+                if value.isdigit():  # "N/A" until the first frame is written
+                    out_time_us = int(value)
+        
+        if out_time_us is None:
+            return
+        
+        # Hold at 99% until ffmpeg actually exits
+        percent = min(99, out_time_us // (10_000 * duration_s))
+        self._set_label(
+            self.status_label, f"⏳ Merging Audio & Video... {percent}%",
+            "color: #ebcb8b; font-size: 13px;"
+        )
+    
+    def _on_merge_finished(
+        self, proc: QProcess, audio_path: str, video_path: str, output_path: str, reencode: bool
+    ) -> None:
+        """Handle ffmpeg exiting after a merge, retrying with a re-encode if a remux failed."""
+        proc.deleteLater()
+        
+        succeeded = proc.exitStatus() == QProcess.ExitStatus.NormalExit and proc.exitCode() == 0
+        if not succeeded and not reencode:
+            self._merge_recordings(audio_path, video_path, reencode=True)
+            return
+        
+        self._end_merge()
+        if succeeded:
+            try:
                 os.remove(audio_path)
                 os.remove(video_path)
-                return output_path
-            else:
-                self.toast.error(f"Merge failed: {result.stderr[:100]}")
-                return audio_path
-                
-        except Exception as e:
-            self.toast.error(f"Merge error: {e}")
-            return audio_path
+            except OSError as e:
+                self.toast.error(f"Merge cleanup error: {e}")
+            self._finish_recording(output_path)
+        else:
+            stderr = bytes(proc.readAllStandardError()).decode(errors='replace')
+            self.toast.error(f"Merge failed: {stderr[:100]}")
+            self._finish_recording(audio_path)
+    
+    def _on_merge_error(self, proc: QProcess, error: QProcess.ProcessError, audio_path: str) -> None:
+        """Handle ffmpeg failing to start (finished is not emitted in that case)."""
+        if error != QProcess.ProcessError.FailedToStart:
+            return  # Crashes etc. are reported through finished
+        proc.deleteLater()
+        self._end_merge()
+        self.toast.error(f"Merge error: {proc.errorString()}")
+        self._finish_recording(audio_path)
+    
+    def _end_merge(self) -> None:
+        """Forget the finished merge process and allow recording again."""
+        self._merge_proc = None
+        self.record_btn.setEnabled(self.device_combo.count() > 0)
     
     def change_output_directory(self) -> None:
         """Open dialog to change output directory."""
@@ -794,19 +1489,31 @@ class MainWindow(QMainWindow):
             self.change_output_btn.setText(f"Save to: .../{os.path.basename(directory)}")
             self.change_output_btn.setToolTip(directory)
             # Rescan history for new directory
-            self.history_widget.scan_directory(directory)
+            self._output_dir_ready = False
+            self._ensure_output_directory()
+            self._refresh_history()
+    
+    def _set_label(self, label: QLabel, text: str, style: str) -> None:
+        """Set a label's text and style, skipping whichever is unchanged."""
+        if label.text() != text:
+            label.setText(text)
+        # Stylesheet changes force a re-polish, so avoid redundant ones
+        if label.styleSheet() != style:
+            label.setStyleSheet(style)
     
     def update_duration_display(self) -> None:
         """Update the recording duration display."""
         if self._is_paused:
             return  # Don't update timer while paused
             
-        duration = self.audio_engine.recording_duration
-        hours = int(duration // 3600)
-        minutes = int((duration % 3600) // 60)
-        seconds = int(duration % 60)
-        
-        time_str = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+        total = int(self.audio_engine.recording_duration)
+        if total == self._last_total_seconds:
+            return  # Same whole second as last tick
+        self._last_total_seconds = total
+        
+        hours, rem = divmod(total, 3600)
+        minutes, seconds = divmod(rem, 60)
+        time_str = "%02d:%02d:%02d" % (hours, minutes, seconds)
         self.duration_label.setText(time_str)
         
         if self.overlay.isVisible():
@@ -814,37 +1521,92 @@ class MainWindow(QMainWindow):
     
     def _on_level_update(self, sys_db: float, mic_db: float) -> None:
         """Handle level update from audio engine (thread-safe)."""
-        self.signal_bridge.level_changed.emit(sys_db, mic_db)
+        self.signal_bridge.levels.append((sys_db, mic_db))
+    
+    def _start_ui_tick(self) -> None:
+        """Start the UI ticker, discarding readings left from a previous recording."""
+        self.signal_bridge.levels.clear()
+        self.signal_bridge.pending_silence.clear()
+        self._last_silence_state = (False, False)
+        self._last_total_seconds = -1
+        self._last_sys_db = self._last_mic_db = float("inf")  # Forces the first update
+        self._ui_tick.start()
+    
+    def _tick_ui(self) -> None:
+        """Refresh the duration and apply the latest audio-thread readings."""
+        self.update_duration_display()
+        
+        # Peak of everything reported since the last tick, so short transients
+        # between ticks still reach the meters
+        # (popleft rather than clear, so an append racing the drain isn't lost)
+        levels = self.signal_bridge.levels
+        if levels:
+            sys_peak, mic_peak = levels.popleft()
+            while levels:
+                sys_db, mic_db = levels.popleft()
+                sys_peak = max(sys_peak, sys_db)
+                mic_peak = max(mic_peak, mic_db)
+            self._update_levels(sys_peak, mic_peak)
+        
+        # Take and clear in one step so a reading published meanwhile isn't lost
+        try:
+            silence = self.signal_bridge.pending_silence.popleft()
+        except IndexError:
+            pass
+        else:
+            self._update_silence_indicators(*silence)
+        
+        self._update_gate_status()
         
-    @pyqtSlot(float, float)
     def _update_levels(self, sys_db: float, mic_db: float) -> None:
         """Update both level meters."""
-        self.sys_level_meter.set_level(sys_db)
-        self.mic_level_meter.set_level(mic_db)
+        # Changes under 0.1 dB (the readout's resolution) aren't visible; skip them
+        if abs(sys_db - self._last_sys_db) >= 0.1:
+            self._last_sys_db = sys_db
+            self.sys_level_meter.set_level(sys_db)
+        if abs(mic_db - self._last_mic_db) >= 0.1:
+            self._last_mic_db = mic_db
+            self.mic_level_meter.set_level(mic_db)
     
     def _on_silence_update(self, sys_warn: bool, sys_dur: float, mic_warn: bool, mic_dur: float) -> None:
         """Handle silence update from audio engine (thread-safe)."""
-        self.signal_bridge.silence_changed.emit(sys_warn, sys_dur, mic_warn, mic_dur)
+        # Durations are only shown while a warning is up; otherwise the UI
+        # only needs to hear about warning state flips
+        state = (sys_warn, mic_warn)
+        if sys_warn or mic_warn or state != self._last_silence_state:
+            self.signal_bridge.pending_silence.append((sys_warn, sys_dur, mic_warn, mic_dur))
+        self._last_silence_state = state
         
-    @pyqtSlot(bool, float, bool, float)
     def _update_silence_indicators(self, sys_warn: bool, sys_dur: float, mic_warn: bool, mic_dur: float) -> None:
         """Update both silence indicators."""
         self.sys_silence_indicator.update_warning(sys_warn, sys_dur)
         self.mic_silence_indicator.update_warning(mic_warn, mic_dur)
         
-        # Update noise gate status indicator
-        if self.noise_gate_check.isChecked() and self.audio_engine.noise_gate_is_open:
-            self.gate_status_label.setText("● OPEN")
-            self.gate_status_label.setStyleSheet("color: #22c55e; font-size: 11px;")
-        elif self.noise_gate_check.isChecked():
-            self.gate_status_label.setText("● CLOSED")
-            self.gate_status_label.setStyleSheet("color: #f59e0b; font-size: 11px;")
-        
         # Auto-Stop Logic (Silence > 5 mins)
         if sys_warn and sys_dur > 300 and self.audio_engine.state == RecordingState.RECORDING:
             self.stop_recording()
             self.toast.warning("Recording stopped: 5 minutes of silence detected")
     
+    def _update_gate_status(self) -> None:
+        """Show whether the noise gate is currently open or closed."""
+        if not self.noise_gate_check.isChecked():
+            return
+        if self.audio_engine.noise_gate_is_open:
+            self._set_gate_status("● OPEN", "open")
+        else:
+            self._set_gate_status("● CLOSED", "closed")
+    
+    def _set_gate_status(self, text: str, state: str) -> None:
+        """Set the gate label's text and color state ("off", "open" or "closed")."""
+        label = self.gate_status_label
+        if label.text() != text:
+            label.setText(text)
+        if label.property("state") != state:
+            # The window stylesheet keys off this property; re-polish to apply it
+            label.setProperty("state", state)
+            label.style().unpolish(label)
+            label.style().polish(label)
+    
     def _on_error(self, message: str) -> None:
         """Handle error from audio engine (thread-safe)."""
         self.signal_bridge.error_occurred.emit(message)
@@ -871,6 +1633,8 @@ class MainWindow(QMainWindow):
             if self.is_recording_video:
                  self.video_engine.stop_recording()
         
+        self._wait_for_merge()
+        
         # Save window state before closing
         self._save_window_state()
         
@@ -880,6 +1644,29 @@ class MainWindow(QMainWindow):
         self.audio_engine.terminate()
         event.accept()
     
+    def _wait_for_merge(self) -> None:
+        """Block until a running ffmpeg merge (and any re-encode retry) has finished."""
+        if self._merge_proc is None:
+            return
+        
+        self._set_label(
+            self.status_label, "⏳ Finishing merge before exit...",
+            "color: #ebcb8b; font-size: 13px;"
+        )
+        self.status_label.repaint()
+        
+        # finished is delivered from inside waitForFinished, so a failed remux
+        # swaps in the re-encode process and the loop waits on that too
+        while self._merge_proc is not None:
+            proc = self._merge_proc
+            if not proc.waitForFinished(-1) and self._merge_proc is proc:
+                break  # Not running and no signal coming; nothing left to wait on
+    
+    def _quit_from_tray(self) -> None:
+        """Quit via the normal close path, so recordings and merges are finished first."""
+        if self.close():
+            QApplication.instance().quit()
+    
     def _save_window_state(self) -> None:
         """Save window geometry and state to QSettings."""
         settings = QSettings("AIRecorder", "BlackHoleRecorder")
@@ -903,193 +1690,3 @@ class MainWindow(QMainWindow):
             self.output_directory = saved_dir
             self.change_output_btn.setText(f"Save to: .../{os.path.basename(saved_dir)}")
             self.change_output_btn.setToolTip(saved_dir)
-    
-    def _get_stylesheet(self) -> str:
-        """Get the application stylesheet."""
-        bg_main = "#020617"
-        card_bg = "#0f172a"
-        border_col = "#1e293b"
-        text_primary = "#f8fafc"
-        text_secondary = "#94a3b8"
-        text_muted = "#64748b"
-        primary_col = "#e11d48"
-        primary_hover = "#be123c"
-        accent_col = "#3b82f6"
-        
-        return f"""
-            QMainWindow {{
-                background-color: {bg_main};
-            }}
-            
-            QWidget {{
-                font-family: ".AppleSystemUIFont", "Inter", "Helvetica Neue", sans-serif;
-                color: {text_primary};
-                font-size: 13px;
-            }}
-            
-            QFrame#cardFrame, QFrame#controlsFrame {{
-                background-color: {card_bg};
-                border: 1px solid {border_col};
-                border-radius: 12px;
-            }}
-            
-            QLabel#sectionTitle {{
-                color: {text_secondary};
-                font-size: 11px;
-                font-weight: 700;
-                letter-spacing: 0.5px;
-            }}
-            
-            QLabel#helperLabel {{
-                color: {text_secondary};
-                font-size: 12px;
-                margin-bottom: 2px;
-            }}
-            
-            QComboBox {{
-                background-color: {bg_main};
-                color: {text_primary};
-                border: 1px solid {border_col};
-                border-radius: 6px;
-                padding: 8px 12px;
-                min-height: 20px;
-            }}
-            
-            QComboBox:hover {{
-                border-color: {text_muted};
-                background-color: {bg_main};
-            }}
-            
-            QComboBox::drop-down {{
-                border: none;
-                width: 24px;
-            }}
-            
-            QComboBox QAbstractItemView {{
-                background-color: {card_bg};
-                color: {text_primary};
-                selection-background-color: {border_col};
-                border: 1px solid {border_col};
-                outline: none;
-                padding: 4px;
-            }}
-            
-            QPushButton {{
-                background-color: {bg_main};
-                color: {text_primary};
-                border: 1px solid {border_col};
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-weight: 500;
-            }}
-            
-            QPushButton:hover {{
-                background-color: {border_col};
-                border-color: {text_muted};
-            }}
-            
-            QPushButton:pressed {{
-                background-color: {bg_main};
-            }}
-            
-            QPushButton#recordBtn {{
-                background-color: {primary_col};
-                border: none;
-                color: white;
-                font-weight: 600;
-                font-size: 14px;
-            }}
-            
-            QPushButton#recordBtn:hover {{
-                background-color: {primary_hover};
-            }}
-            
-            QPushButton#pauseBtn {{
-                background-color: #f59e0b;
-                border: none;
-                color: white;
-                font-weight: 600;
-                font-size: 13px;
-            }}
-            
-            QPushButton#pauseBtn:hover {{
-                background-color: #d97706;
-            }}
-            
-            QPushButton#pauseBtn:disabled {{
-                background-color: {border_col};
-                color: {text_muted};
-            }}
-            
-            QPushButton#stopBtn {{
-                background-color: transparent;
-                border: 1px solid {border_col};
-                color: {text_secondary};
-            }}
-            
-            QPushButton#stopBtn:enabled {{
-                 border: 1px solid {primary_col};
-                 color: {primary_col};
-            }}
-             
-            QPushButton#stopBtn:enabled:hover {{
-                 background-color: rgba(225, 29, 72, 0.1);
-            }}
-            
-            QPushButton#iconBtn {{
-                background-color: transparent;
-                border: none;
-                font-size: 18px;
-                color: {text_secondary};
-            }}
-            
-            QPushButton#iconBtn:hover {{
-                color: {text_primary};
-                background-color: {border_col};
-                border-radius: 6px;
-            }}
-            
-            QPushButton#ghostBtn {{
-                background-color: transparent;
-                border: none;
-                color: {text_muted};
-                text-align: right;
-                padding: 4px;
-            }}
-            
-            QPushButton#ghostBtn:hover {{
-                color: {text_primary};
-                text-decoration: underline;
-            }}
-            
-            QCheckBox {{
-                spacing: 8px;
-                color: {text_primary};
-                font-weight: 500;
-            }}
-            
-            QCheckBox::indicator {{
-                width: 18px;
-                height: 18px;
-                border: 2px solid {text_muted};
-                border-radius: 4px;
-                background: transparent;
-            }}
-            
-            QCheckBox::indicator:checked {{
-                background-color: {accent_col};
-                border-color: {accent_col};
-            }}
-             
-            QScrollBar:vertical {{
-                 border: none;
-                 background: {bg_main};
-                 width: 10px;
-                 margin: 0px 0px 0px 0px;
-            }}
-            QScrollBar::handle:vertical {{
-                 background: {border_col};
-                 min-height: 20px;
-                 border-radius: 5px;
-            }}
-        """
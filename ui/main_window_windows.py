@@ -4,14 +4,14 @@ Windows-specific wrapper around the primary application window.
 """
 
 import os
-import subprocess
-from datetime import datetime
-from typing import Optional
+import shutil
+import time
 
-from PyQt6.QtWidgets import QApplication, QMessageBox
+from PyQt6.QtCore import QProcess
+from PyQt6.QtWidgets import QMessageBox
 
 import ui.main_window as base_main_window
-from audio_engine import AudioDevice, RecordingState
+from audio_engine import RecordingState
 from hotkey_manager_windows import HotkeyManagerWindows
 
 # Swap the hotkey manager only for this Windows entrypoint.
@@ -26,28 +26,29 @@ class MainWindowWindows(base_main_window.MainWindow):
         self.output_directory = os.path.expanduser("~/Music/AIrecorder Recordings")
         self.change_output_btn.setText(f"Save to: .../{os.path.basename(self.output_directory)}")
         self.change_output_btn.setToolTip(self.output_directory)
+        self.reveal_btn.setToolTip("Reveal in File Explorer")
 
     def start_recording(self) -> None:
         """Start audio recording with Windows-specific FFmpeg hint."""
         if self.device_combo.count() == 0:
             return
 
-        device: AudioDevice = self.device_combo.currentData()
+        device = self._devices_by_index.get(self.device_combo.currentData())
         if not device:
             return
 
-        os.makedirs(self.output_directory, exist_ok=True)
+        self._ensure_output_directory()
 
         mic_index = None
-        if self.mic_check.isChecked() and self.mic_combo.currentData():
-            mic_device: AudioDevice = self.mic_combo.currentData()
-            mic_index = mic_device.index
+        if self.mic_check.isChecked():
+            mic_index = self.mic_combo.currentData()
 
         self.is_recording_video = self.screen_record_check.isChecked()
         if self.is_recording_video:
-            try:
-                subprocess.run(["ffmpeg", "-version"], capture_output=True, check=True)
-            except (subprocess.CalledProcessError, FileNotFoundError):
+            if self._ffmpeg_path is None:
+                # May have been installed since launch
+                self._ffmpeg_path = shutil.which("ffmpeg")
+            if self._ffmpeg_path is None:
                 QMessageBox.critical(
                     self,
                     "FFmpeg Missing",
@@ -71,25 +72,15 @@ class MainWindowWindows(base_main_window.MainWindow):
         )
 
         if success:
-            self._recording_start_time = datetime.now()
-            self.duration_timer.start(100)
+            self._recording_start_time = time.monotonic()
+            self._start_ui_tick()
 
-            self.record_btn.setEnabled(False)
-            self.stop_btn.setEnabled(True)
-            self.device_combo.setEnabled(False)
-            self.mic_check.setEnabled(False)
-            self.mic_combo.setEnabled(False)
-            self.screen_record_check.setEnabled(False)
-            self.screen_combo.setEnabled(False)
-            self.refresh_btn.setEnabled(False)
-
-            self.status_label.setText(f"🔴 Recording from: {device.name}")
-            self.status_label.setStyleSheet("color: #ff4444; font-size: 13px;")
-
-            self.record_btn.setText("Recording...")
-            self.rec_dot.setVisible(True)
+            self._set_recording_ui_state(True)
+            self._set_label(
+                self.status_label, f"🔴 Recording from: {device.name}",
+                "color: #ff4444; font-size: 13px;",
+            )
 
-            self.tray_action_toggle.setText("Stop Recording")
             self._set_tray_icon_color("red")
 
             self.overlay.show()
@@ -101,9 +92,19 @@ class MainWindowWindows(base_main_window.MainWindow):
                 f"Could not start recording from {device.name}.\nPlease check the device is available.",
             )
 
+    def _set_recording_ui_state(self, recording: bool) -> None:
+        """Switch controls between states; no pause control, mic choice locked while recording."""
+        super()._set_recording_ui_state(recording)
+
+        # Adjustments land in the same pending repaint as the base changes
+        self.pause_btn.setVisible(False)
+        self.mic_check.setEnabled(not recording)
+        if not recording:
+            self.screen_combo.setEnabled(self.screen_record_check.isChecked())
+
     def stop_recording(self) -> None:
-        """Stop audio recording and reveal result in File Explorer."""
-        self.duration_timer.stop()
+        """Stop audio recording and save file."""
+        self._ui_tick.stop()
 
         audio_path = self.audio_engine.stop_recording()
 
@@ -111,55 +112,25 @@ class MainWindowWindows(base_main_window.MainWindow):
         if self.is_recording_video:
             video_path = self.video_engine.stop_recording()
 
-        self.record_btn.setEnabled(True)
-        self.stop_btn.setEnabled(False)
-        self.device_combo.setEnabled(True)
-        self.mic_check.setEnabled(True)
-        self.mic_combo.setEnabled(self.mic_check.isChecked())
-        self.screen_record_check.setEnabled(True)
-        self.screen_combo.setEnabled(self.screen_record_check.isChecked())
-        self.refresh_btn.setEnabled(True)
-
-        self.record_btn.setText("Start Recording")
-        self.rec_dot.setVisible(False)
-        self.sys_silence_indicator.reset()
-        self.mic_silence_indicator.reset()
-
-        self.tray_action_toggle.setText("Start Recording")
+        self._set_recording_ui_state(False)
+
         self._set_tray_icon_color("black")
 
         self.overlay.hide()
 
-        final_path = audio_path
-
         if self.is_recording_video and audio_path and video_path:
-            self.status_label.setText("⏳ Merging Audio & Video...")
-            self.status_label.setStyleSheet("color: #ebcb8b; font-size: 13px;")
-            QApplication.processEvents()
-
-            final_path = self._merge_recordings(audio_path, video_path)
-
-        if final_path and os.path.exists(final_path):
-            file_size = os.path.getsize(final_path) / 1024 / 1024
-            self.status_label.setText(f"✅ Saved: {os.path.basename(final_path)} ({file_size:.1f} MB)")
-            self.status_label.setStyleSheet("color: #00cc66; font-size: 13px;")
-
-            reply = QMessageBox.information(
-                self,
-                "Recording Saved",
-                f"Recording saved to:\n{final_path}\n\nWould you like to reveal it in File Explorer?",
-                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            self._set_label(
+                self.status_label, "⏳ Merging Audio & Video...",
+                "color: #ebcb8b; font-size: 13px;",
             )
-
-            if reply == QMessageBox.StandardButton.Yes:
-                self._reveal_in_explorer(final_path)
+            # Finishes asynchronously via _finish_recording
+            self._merge_recordings(audio_path, video_path)
         else:
-            self.status_label.setText("Ready to record")
-            self.status_label.setStyleSheet("color: #888; font-size: 13px;")
+            self._finish_recording(audio_path)
 
-    def _reveal_in_explorer(self, file_path: str) -> None:
+    def _reveal_in_file_manager(self, file_path: str) -> None:
         """Reveal a file in Windows File Explorer."""
-        try:
-            subprocess.run(["explorer", f"/select,{os.path.normpath(file_path)}"], check=False)
-        except Exception as exc:
-            print(f"Failed to open File Explorer: {exc}")
+        # Detached: nothing waits on explorer or holds its pipes
+        started, _ = QProcess.startDetached("explorer", [f"/select,{os.path.normpath(file_path)}"])
+        if not started:
+            print("Failed to open File Explorer")
@@ -3,9 +3,36 @@ Floating Overlay Widget
 Minimal control overlay for screen recording.
 """
 
+from typing import Optional
+
 from PyQt6.QtWidgets import QWidget, QHBoxLayout, QLabel, QPushButton, QApplication
 from PyQt6.QtCore import Qt, pyqtSignal, QPoint
-from PyQt6.QtGui import QFont, QColor, QPainter
+from PyQt6.QtGui import QFont, QColor, QPainter, QPixmap
+
+# Stylesheets for every button/timer state, built once at import so state
+# changes only hand Qt an existing string
+_ROUND_BUTTON_QSS = """
+    QPushButton {
+        background-color: %s;
+        border: none;
+        border-radius: 16px;
+        color: %s;
+        font-size: 14px;
+    }
+    QPushButton:hover {
+        background-color: %s;
+    }
+"""
+_PAUSE_QSS = _ROUND_BUTTON_QSS % ("#f59e0b", "white", "#fbbf24")
+_RESUME_QSS = _ROUND_BUTTON_QSS % ("#22c55e", "white", "#4ade80")
+_STOP_QSS = _ROUND_BUTTON_QSS % ("#ff4444", "white", "#ff6666")
+_MIC_ACTIVE_QSS = _ROUND_BUTTON_QSS % ("#3b82f6", "white", "#60a5fa")
+_MIC_INACTIVE_QSS = _ROUND_BUTTON_QSS % ("#374151", "#9ca3af", "#4b5563")
+
+_TIMER_QSS = "color: %s; font-family: Monaco; font-weight: bold; font-size: 14px;"
+_TIMER_WHITE_QSS = _TIMER_QSS % "white"
+_TIMER_AMBER_QSS = _TIMER_QSS % "#f59e0b"
+
 
 class OverlayWidget(QWidget):
     """
@@ -25,6 +52,7 @@ class OverlayWidget(QWidget):
             Qt.WindowType.WindowStaysOnTopHint
         )
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
+        self.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground)
         
         self.draggable = True
         self._dragging = False
@@ -37,6 +65,7 @@ class OverlayWidget(QWidget):
     def setup_ui(self):
         """Set up the UI."""
         self.setFixedSize(310, 50)
+        self._background: Optional[QPixmap] = None  # Rendered on first paint
         
         # Main layout
         layout = QHBoxLayout(self)
@@ -45,7 +74,7 @@ class OverlayWidget(QWidget):
         
         # Timer Label
         self.timer_label = QLabel("00:00:00")
-        self.timer_label.setStyleSheet("color: white; font-family: Monaco; font-weight: bold; font-size: 14px;")
+        self.timer_label.setStyleSheet(_TIMER_WHITE_QSS)
         layout.addWidget(self.timer_label)
         
         layout.addStretch()
@@ -64,18 +93,7 @@ class OverlayWidget(QWidget):
         self.pause_btn.setFixedSize(32, 32)
         self.pause_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         self.pause_btn.setToolTip("Pause Recording")
-        self.pause_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #f59e0b;
-                border: none;
-                border-radius: 16px;
-                color: white;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #fbbf24;
-            }
-        """)
+        self.pause_btn.setStyleSheet(_PAUSE_QSS)
         self.pause_btn.clicked.connect(self._on_pause_clicked)
         layout.addWidget(self.pause_btn)
         
@@ -84,18 +102,7 @@ class OverlayWidget(QWidget):
         self.stop_btn.setFixedSize(32, 32)
         self.stop_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         self.stop_btn.setToolTip("Stop Recording")
-        self.stop_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #ff4444;
-                border: none;
-                border-radius: 16px;
-                color: white;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #ff6666;
-            }
-        """)
+        self.stop_btn.setStyleSheet(_STOP_QSS)
         self.stop_btn.clicked.connect(self.stop_clicked.emit)
         layout.addWidget(self.stop_btn)
         
@@ -109,35 +116,13 @@ class OverlayWidget(QWidget):
         if paused:
             self.pause_btn.setText("▶")
             self.pause_btn.setToolTip("Resume Recording")
-            self.pause_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #22c55e;
-                    border: none;
-                    border-radius: 16px;
-                    color: white;
-                    font-size: 14px;
-                }
-                QPushButton:hover {
-                    background-color: #4ade80;
-                }
-            """)
-            self.timer_label.setStyleSheet("color: #f59e0b; font-family: Monaco; font-weight: bold; font-size: 14px;")
+            self.pause_btn.setStyleSheet(_RESUME_QSS)
+            self.timer_label.setStyleSheet(_TIMER_AMBER_QSS)
         else:
             self.pause_btn.setText("⏸")
             self.pause_btn.setToolTip("Pause Recording")
-            self.pause_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #f59e0b;
-                    border: none;
-                    border-radius: 16px;
-                    color: white;
-                    font-size: 14px;
-                }
-                QPushButton:hover {
-                    background-color: #fbbf24;
-                }
-            """)
-            self.timer_label.setStyleSheet("color: white; font-family: Monaco; font-weight: bold; font-size: 14px;")
+            self.pause_btn.setStyleSheet(_PAUSE_QSS)
+            self.timer_label.setStyleSheet(_TIMER_WHITE_QSS)
     
     def set_mic_active(self, active: bool):
         """Update mic button visual state."""
@@ -146,32 +131,7 @@ class OverlayWidget(QWidget):
     
     def _update_mic_style(self, active: bool):
         """Update mic button styling."""
-        if active:
-            self.mic_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #3b82f6;
-                    border: none;
-                    border-radius: 16px;
-                    color: white;
-                    font-size: 14px;
-                }
-                QPushButton:hover {
-                    background-color: #60a5fa;
-                }
-            """)
-        else:
-            self.mic_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #374151;
-                    border: none;
-                    border-radius: 16px;
-                    color: #9ca3af;
-                    font-size: 14px;
-                }
-                QPushButton:hover {
-                    background-color: #4b5563;
-                }
-            """)
+        self.mic_btn.setStyleSheet(_MIC_ACTIVE_QSS if active else _MIC_INACTIVE_QSS)
     
     def _on_mic_clicked(self):
         """Handle mic button click."""
@@ -183,15 +143,33 @@ class OverlayWidget(QWidget):
         """Handle pause button click."""
         self.pause_clicked.emit()
         
-    def paintEvent(self, event):
-        """Paint semi-transparent background."""
-        painter = QPainter(self)
+    def _render_background(self, ratio: float) -> QPixmap:
+        """Rasterize the rounded background at a device pixel ratio (the size is fixed)."""
+        pixmap = QPixmap(self.size() * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        
+        painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
         # Draw rounded rectangle background
         painter.setBrush(QColor(0, 0, 0, 180))  # Black with opacity
         painter.setPen(Qt.PenStyle.NoPen)
         painter.drawRoundedRect(self.rect(), 25, 25)
+        painter.end()
+        
+        return pixmap
+    
+    def paintEvent(self, event):
+        """Paint semi-transparent background."""
+        # Blit the prerendered background instead of re-filling the path;
+        # re-render only if the window moved to a screen with another ratio
+        ratio = self.devicePixelRatioF()
+        if self._background is None or self._background.devicePixelRatio() != ratio:
+            self._background = self._render_background(ratio)
+        
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._background)
         
     # --- Dragging Logic ---
     def mousePressEvent(self, event):
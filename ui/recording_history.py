@@ -4,37 +4,49 @@ Displays a list of past recordings with metadata and actions.
 """
 
 import os
-import subprocess
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Tuple
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
     QPushButton, QScrollArea, QFrame, QSizePolicy
 )
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QFont
+from PyQt6.QtCore import Qt, pyqtSignal, QProcess
+from PyQt6.QtGui import QFont, QPainter, QPixmap
+
+
+# File-type icons rasterized once per (emoji, device pixel ratio) and shared
+# by every entry, so painting the list blits pixmaps instead of shaping emoji
+_ICON_PIXMAPS: dict = {}
+
+
+def _icon_pixmap(emoji: str, ratio: float) -> QPixmap:
+    """Get the 28x28 pixmap for a file-type emoji, rendering it on first use."""
+    pixmap = _ICON_PIXMAPS.get((emoji, ratio))
+    if pixmap is None:
+        pixmap = QPixmap(round(28 * ratio), round(28 * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        
+        painter = QPainter(pixmap)
+        painter.setFont(QFont("Apple Color Emoji", 16))
+        painter.drawText(0, 0, 28, 28, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, emoji)
+        painter.end()
+        
+        _ICON_PIXMAPS[(emoji, ratio)] = pixmap
+    return pixmap
 
 
 class RecordingEntry(QFrame):
     """A single recording entry in the history list."""
     
-    def __init__(self, filepath: str, parent=None):
+    _ICONS = {".mp3": "🎵", ".wav": "🎵", ".mp4": "🎬", ".m4a": "🎵"}
+    
+    def __init__(self, filepath: str, parent=None, stat_result: Optional[os.stat_result] = None):
         super().__init__(parent)
         self.filepath = filepath
-        self.setObjectName("recordingEntry")
-        self.setStyleSheet("""
-            #recordingEntry {
-                background-color: #020617;
-                border: 1px solid #1e293b;
-                border-radius: 8px;
-                padding: 4px;
-            }
-            #recordingEntry:hover {
-                border-color: #334155;
-                background-color: #0f172a;
-            }
-        """)
+        self._stat = stat_result  # From the directory scan, if there was one
+        self.setObjectName("recordingEntry")  # Styled by RecordingHistoryWidget
         
         self._setup_ui()
         
@@ -44,11 +56,14 @@ class RecordingEntry(QFrame):
         layout.setContentsMargins(12, 8, 12, 8)
         layout.setSpacing(12)
         
+        # Name and extension, split once from the path
+        basename = os.path.basename(self.filepath)
+        dot = basename.rfind(".")
+        ext = basename[dot:].lower() if dot > 0 else ""
+        
         # File type icon
-        ext = os.path.splitext(self.filepath)[1].lower()
-        icon_map = {".mp3": "🎵", ".wav": "🎵", ".mp4": "🎬", ".m4a": "🎵"}
-        icon = QLabel(icon_map.get(ext, "📄"))
-        icon.setFont(QFont("Apple Color Emoji", 16))
+        icon = QLabel()
+        icon.setPixmap(_icon_pixmap(self._ICONS.get(ext, "📄"), self.devicePixelRatioF()))
         icon.setFixedWidth(28)
         layout.addWidget(icon)
         
@@ -57,16 +72,15 @@ class RecordingEntry(QFrame):
         info_layout.setSpacing(2)
         
         # Filename
-        basename = os.path.basename(self.filepath)
         name_label = QLabel(basename)
-        name_label.setStyleSheet("color: #f8fafc; font-size: 12px; font-weight: 600;")
+        name_label.setObjectName("recordingName")
         name_label.setToolTip(self.filepath)
         info_layout.addWidget(name_label)
         
         # Metadata row
         meta_parts = []
         try:
-            stat = os.stat(self.filepath)
+            stat = self._stat or os.stat(self.filepath)
             size_mb = stat.st_size / (1024 * 1024)
             if size_mb >= 1.0:
                 meta_parts.append(f"{size_mb:.1f} MB")
@@ -80,7 +94,7 @@ class RecordingEntry(QFrame):
             meta_parts.append("Unknown")
             
         meta_label = QLabel(" · ".join(meta_parts))
-        meta_label.setStyleSheet("color: #64748b; font-size: 11px;")
+        meta_label.setObjectName("recordingMeta")
         info_layout.addWidget(meta_label)
         
         layout.addLayout(info_layout, 1)
@@ -90,37 +104,70 @@ class RecordingEntry(QFrame):
         reveal_btn.setFixedSize(32, 32)
         reveal_btn.setToolTip("Reveal in Finder")
         reveal_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        reveal_btn.setStyleSheet("""
-            QPushButton {
-                background: transparent;
-                border: 1px solid #1e293b;
-                border-radius: 6px;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #1e293b;
-            }
-        """)
         reveal_btn.clicked.connect(self._reveal_in_finder)
         layout.addWidget(reveal_btn)
         
     def _reveal_in_finder(self) -> None:
         """Open Finder with file selected."""
         if os.path.exists(self.filepath):
-            subprocess.run(["open", "-R", self.filepath])
+            # Detached and shell-free: returns immediately, path passed as argv
+            QProcess.startDetached("open", ["-R", self.filepath])
 
 
 class RecordingHistoryWidget(QWidget):
     """
     Scrollable list of past recordings.
     Scans the output directory for audio/video files.
+    
+    Entry widgets are built a page at a time: the newest PAGE_SIZE
+    recordings up front, the next page whenever the list is scrolled near
+    its end, so large folders don't create hundreds of widgets at once.
+    """
+    
+    # Entry styles live here, on the list's parent, so the sheet is parsed
+    # once rather than once per entry
+    _QSS = """
+        #recordingEntry {
+            background-color: #020617;
+            border: 1px solid #1e293b;
+            border-radius: 8px;
+            padding: 4px;
+        }
+        #recordingEntry:hover {
+            border-color: #334155;
+            background-color: #0f172a;
+        }
+        QLabel#recordingName {
+            color: #f8fafc;
+            font-size: 12px;
+            font-weight: 600;
+        }
+        QLabel#recordingMeta {
+            color: #64748b;
+            font-size: 11px;
+        }
+        #recordingEntry QPushButton {
+            background: transparent;
+            border: 1px solid #1e293b;
+            border-radius: 6px;
+            font-size: 14px;
+        }
+        #recordingEntry QPushButton:hover {
+            background-color: #1e293b;
+        }
     """
     
     SUPPORTED_EXTENSIONS = {".mp3", ".wav", ".mp4", ".m4a", ".flac"}
+    # Same set as a tuple for str.endswith, the scan's per-file filter
+    _EXTENSION_SUFFIXES = tuple(SUPPORTED_EXTENSIONS)
+    PAGE_SIZE = 50
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self._entries: List[RecordingEntry] = []
+        # Every known recording (newest first); the first _limit have entries
+        self._files: List[Tuple[str, Optional[os.stat_result]]] = []
+        self._limit = self.PAGE_SIZE
         self._setup_ui()
         
     def _setup_ui(self) -> None:
@@ -129,6 +176,8 @@ class RecordingHistoryWidget(QWidget):
         main_layout.setContentsMargins(0, 0, 0, 0)
         main_layout.setSpacing(8)
         
+        self.setStyleSheet(self._QSS)
+        
         # Header
         header = QHBoxLayout()
         title = QLabel("RECORDING HISTORY")
@@ -167,46 +216,108 @@ class RecordingHistoryWidget(QWidget):
         scroll.setWidget(self.scroll_content)
         main_layout.addWidget(scroll)
         
+        # Load further pages near the bottom (range changes cover a list
+        # too short to scroll)
+        self._scroll_bar = scroll.verticalScrollBar()
+        self._scroll_bar.valueChanged.connect(self._on_scrolled)
+        self._scroll_bar.rangeChanged.connect(lambda *_: self._on_scrolled(self._scroll_bar.value()))
+        
         # Empty state
         self.empty_label = QLabel("No recordings yet")
         self.empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.empty_label.setStyleSheet("color: #475569; font-size: 12px; padding: 20px;")
         self.list_layout.insertWidget(0, self.empty_label)
         
-    def scan_directory(self, directory: str) -> None:
-        """Scan a directory for existing recordings and populate the list."""
-        if not os.path.isdir(directory):
-            return
+    @classmethod
+    def list_recordings(cls, directory: str) -> List[Tuple[str, os.stat_result]]:
+        """
+        List the recordings in a directory with their stats, newest first.
         
+        Touches no widgets, so it can run on a worker thread. One scandir
+        pass stats each file once; the entries reuse that stat for display.
+        """
         files = []
-        for f in os.listdir(directory):
-            ext = os.path.splitext(f)[1].lower()
-            if ext in self.SUPPORTED_EXTENSIONS:
-                filepath = os.path.join(directory, f)
-                files.append(filepath)
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if not entry.name.lower().endswith(cls._EXTENSION_SUFFIXES):
+                        continue
+                    try:
+                        if entry.is_file():
+                            files.append((entry.path, entry.stat()))
+                    except OSError:
+                        continue  # Removed while scanning
+        except OSError:
+            return []  # Missing or unreadable directory
         
         # Sort by modification time (newest first)
-        files.sort(key=lambda f: os.path.getmtime(f), reverse=True)
-        
-        for filepath in files:
-            self._add_entry(filepath, prepend=False)
+        files.sort(key=lambda item: item[1].st_mtime, reverse=True)
+        return files
+    
+    def scan_directory(self, directory: str) -> None:
+        """Scan a directory for existing recordings and populate the list."""
+        self.set_recordings(self.list_recordings(directory))
+    
+    def set_recordings(self, files: List[Tuple[str, os.stat_result]]) -> None:
+        """Show the given (path, stat) recordings, newest first."""
+        self._files = list(files)
+        self._sync_entries()
             
-    def add_recording(self, filepath: str) -> None:
-        """Add a new recording to the top of the list."""
-        self._add_entry(filepath, prepend=True)
+    def add_recording(self, filepath: str, stat_result: Optional[os.stat_result] = None) -> None:
+        """
+        Add a new recording to the top of the list.
         
-    def _add_entry(self, filepath: str, prepend: bool = True) -> None:
-        """Add an entry widget."""
-        # Hide empty label
-        self.empty_label.hide()
+        Pass the file's stat if the caller already has it, so the entry
+        doesn't stat it again on the UI thread.
+        """
+        if any(path == filepath for path, _ in self._files):
+            return  # Already picked up by a rescan
+        self._files.insert(0, (filepath, stat_result))
+        self._sync_entries()
+    
+    def _on_scrolled(self, value: int) -> None:
+        """Build the next page of entries once the list is scrolled near its end."""
+        if self._limit < len(self._files) and value >= self._scroll_bar.maximum() - 200:
+            self._limit += self.PAGE_SIZE
+            self._sync_entries()
+        
+    def _sync_entries(self) -> None:
+        """
+        Make the entry widgets match the first _limit recordings.
         
-        entry = RecordingEntry(filepath)
-        self._entries.append(entry)
+        Entries whose files are gone are removed and only new files get an
+        entry, so a rescan doesn't rebuild the whole list.
+        """
+        shown = self._files[:self._limit]
+        wanted = {filepath for filepath, _ in shown}
         
-        if prepend:
-            self.list_layout.insertWidget(0, entry)
-        else:
-            # Insert before the stretch
-            self.list_layout.insertWidget(self.list_layout.count() - 1, entry)
+        # Repaint once for the whole batch of inserts and removals
+        self.scroll_content.setUpdatesEnabled(False)
+        for entry in [e for e in self._entries if e.filepath not in wanted]:
+            self._entries.remove(entry)
+            self.list_layout.removeWidget(entry)
+            entry.deleteLater()
         
-        self.count_label.setText(f"{len(self._entries)} file{'s' if len(self._entries) != 1 else ''}")
+        # Walk oldest to newest so each new entry goes just above the one
+        # after it (or above the stretch at the end)
+        by_path = {entry.filepath: entry for entry in self._entries}
+        next_entry = None
+        for filepath, stat_result in reversed(shown):
+            entry = by_path.get(filepath)
+            if entry is None:
+                if next_entry is not None:
+                    index = self.list_layout.indexOf(next_entry)
+                else:
+                    index = self.list_layout.count() - 1
+                entry = RecordingEntry(filepath, stat_result=stat_result)
+                self._entries.append(entry)
+                self.list_layout.insertWidget(index, entry)
+            next_entry = entry
+        
+        self.scroll_content.setUpdatesEnabled(True)
+        self._update_count()
+    
+    def _update_count(self) -> None:
+        """Refresh the file count and the empty-state label."""
+        self.empty_label.setVisible(not self._files)
+        self.count_label.setText(f"{len(self._files)} file{'s' if len(self._files) != 1 else ''}")
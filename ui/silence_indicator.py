@@ -21,11 +21,51 @@ class SilenceIndicator(QFrame):
         "4. Open Audio MIDI Setup to verify configuration"
     ]
     
+    # One stylesheet for the container and all of its labels, parsed once
+    # per indicator. Flashing only flips the title's "flash" property.
+    _QSS = """
+        #silenceWarning {
+            background-color: rgba(69, 10, 10, 0.95); /* darker red background */
+            border: 1px solid #dc2626; /* red-600 */
+            border-radius: 12px;
+        }
+        QLabel#silenceTitle {
+            font-size: 16px;
+            font-weight: bold;
+            color: #ff4444;
+            padding: 8px;
+        }
+        QLabel#silenceTitle[flash="true"] {
+            color: #ff6666;
+            background-color: rgba(255, 68, 68, 0.2);
+            border-radius: 4px;
+        }
+        QLabel#silenceDuration {
+            font-size: 13px;
+            color: #ffaa00;
+        }
+        QLabel#silenceSeparator {
+            background-color: #444;
+        }
+        QLabel#silenceTipsTitle {
+            font-size: 12px;
+            font-weight: bold;
+            color: #aaa;
+            margin-top: 8px;
+        }
+        QLabel#silenceTip {
+            font-size: 11px;
+            color: #888;
+            padding-left: 8px;
+        }
+    """
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         
         self._is_warning_active = False
         self._flash_state = False
+        self._duration_text = ""  # Last text given to duration_label
         
         self.setup_ui()
         self.setup_animation()
@@ -48,61 +88,38 @@ class SilenceIndicator(QFrame):
         
         # Warning icon and title
         self.title_label = QLabel("⚠️ SILENCE DETECTED")
+        self.title_label.setObjectName("silenceTitle")
         self.title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.title_label.setStyleSheet("""
-            font-size: 16px;
-            font-weight: bold;
-            color: #ff4444;
-            padding: 8px;
-        """)
         layout.addWidget(self.title_label)
         
         # Duration label
         self.duration_label = QLabel("Silent for: 0.0s")
+        self.duration_label.setObjectName("silenceDuration")
         self.duration_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.duration_label.setStyleSheet("""
-            font-size: 13px;
-            color: #ffaa00;
-        """)
         layout.addWidget(self.duration_label)
         
         # Separator
         separator = QLabel()
         separator.setFixedHeight(1)
-        separator.setStyleSheet("background-color: #444;")
+        separator.setObjectName("silenceSeparator")
         layout.addWidget(separator)
         
         # Troubleshooting section
         tips_title = QLabel("💡 Troubleshooting Tips:")
-        tips_title.setStyleSheet("""
-            font-size: 12px;
-            font-weight: bold;
-            color: #aaa;
-            margin-top: 8px;
-        """)
+        tips_title.setObjectName("silenceTipsTitle")
         layout.addWidget(tips_title)
         
         # Tips list
         for tip in self.TROUBLESHOOTING_TIPS:
             tip_label = QLabel(tip)
-            tip_label.setStyleSheet("""
-                font-size: 11px;
-                color: #888;
-                padding-left: 8px;
-            """)
+            tip_label.setObjectName("silenceTip")
             tip_label.setWordWrap(True)
             layout.addWidget(tip_label)
         
         layout.addStretch()
         
-        # Style the container
-        self.setStyleSheet("""
-            #silenceWarning {
-                background-color: rgba(69, 10, 10, 0.95); /* darker red background */
-                border: 1px solid #dc2626; /* red-600 */
-                border-radius: 12px;
-            }
-        """)
+        # Style the container and its labels
+        self.setStyleSheet(self._QSS)
     
     def setup_animation(self) -> None:
         """Set up the flash animation."""
@@ -112,24 +129,18 @@ class SilenceIndicator(QFrame):
     
     def _toggle_flash(self) -> None:
         """Toggle the flash state for animation."""
-        self._flash_state = not self._flash_state
-        
-        if self._flash_state:
-            self.title_label.setStyleSheet("""
-                font-size: 16px;
-                font-weight: bold;
-                color: #ff6666;
-                background-color: rgba(255, 68, 68, 0.2);
-                padding: 8px;
-                border-radius: 4px;
-            """)
-        else:
-            self.title_label.setStyleSheet("""
-                font-size: 16px;
-                font-weight: bold;
-                color: #ff4444;
-                padding: 8px;
-            """)
+        self._set_flash(not self._flash_state)
+    
+    def _set_flash(self, flash: bool) -> None:
+        """Show the title in its flashed or idle style."""
+        if flash == self._flash_state:
+            return  # Already showing it; skip the re-polish
+        self._flash_state = flash
+        
+        # The stylesheet keys off this property; re-polish to apply it
+        self.title_label.setProperty("flash", flash)
+        self.title_label.style().unpolish(self.title_label)
+        self.title_label.style().polish(self.title_label)
     
     @pyqtSlot(bool, float)
     def update_warning(self, is_warning_active: bool, silence_duration: float) -> None:
@@ -140,6 +151,10 @@ class SilenceIndicator(QFrame):
             is_warning_active: Whether to show the warning.
             silence_duration: Duration of silence in seconds.
         """
+        # Common case: still no warning (e.g. only the other source is silent)
+        if not is_warning_active and not self._is_warning_active:
+            return
+        
         if is_warning_active and not self._is_warning_active:
             # Warning just activated
             self.show()
@@ -147,20 +162,25 @@ class SilenceIndicator(QFrame):
             self._is_warning_active = True
             
         elif not is_warning_active and self._is_warning_active:
-            # Warning deactivated
+            # Warning deactivated; next time it starts from the idle title
             self.hide()
             self._flash_timer.stop()
+            self._set_flash(False)
             self._is_warning_active = False
         
         if is_warning_active:
-            self.duration_label.setText(f"Silent for: {silence_duration:.1f}s")
+            # Updates arrive every UI tick, but the text only changes every 0.1s
+            text = f"Silent for: {silence_duration:.1f}s"
+            if text != self._duration_text:
+                self._duration_text = text
+                self.duration_label.setText(text)
     
     def reset(self) -> None:
         """Reset the indicator to hidden state."""
         self.hide()
         self._flash_timer.stop()
+        self._set_flash(False)
         self._is_warning_active = False
-        self._flash_state = False
 
     def set_title(self, title: str) -> None:
         """Set the warning title text."""
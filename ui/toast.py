@@ -34,6 +34,8 @@ class ToastNotification(QWidget):
         "error": "#ef4444",
     }
     
+    MESSAGE_QSS = "color: #f8fafc; font-size: 13px; font-weight: 500;"
+    
     def __init__(self, message: str, toast_type: str = "info", duration_ms: int = 3000, parent=None):
         super().__init__(parent)
         
@@ -56,6 +58,9 @@ class ToastNotification(QWidget):
         self._dismiss_timer.setSingleShot(True)
         self._dismiss_timer.timeout.connect(self.fade_out)
         
+        # One animation, retargeted for the slide in and the slide out
+        self._slide_anim = QPropertyAnimation(self, b"pos", self)
+        
     def _setup_ui(self, message: str, toast_type: str) -> None:
         """Build the toast UI."""
         self.setFixedHeight(48)
@@ -73,7 +78,7 @@ class ToastNotification(QWidget):
         
         # Message
         msg_label = QLabel(message)
-        msg_label.setStyleSheet(f"color: #f8fafc; font-size: 13px; font-weight: 500;")
+        msg_label.setStyleSheet(self.MESSAGE_QSS)
         msg_label.setWordWrap(False)
         layout.addWidget(msg_label, 1)
         
@@ -108,7 +113,6 @@ class ToastNotification(QWidget):
         start_pos = QPoint(screen.width(), end_y)
         end_pos = QPoint(end_x, end_y)
         
-        self._slide_anim = QPropertyAnimation(self, b"pos")
         self._slide_anim.setDuration(300)
         self._slide_anim.setStartValue(start_pos)
         self._slide_anim.setEndValue(end_pos)
@@ -123,13 +127,13 @@ class ToastNotification(QWidget):
         # Slide out to right
         screen = QApplication.primaryScreen().geometry()
         
-        self._slide_out = QPropertyAnimation(self, b"pos")
-        self._slide_out.setDuration(250)
-        self._slide_out.setStartValue(self.pos())
-        self._slide_out.setEndValue(QPoint(screen.width(), self.y()))
-        self._slide_out.setEasingCurve(QEasingCurve.Type.InCubic)
-        self._slide_out.finished.connect(self._on_closed)
-        self._slide_out.start()
+        self._slide_anim.stop()
+        self._slide_anim.setDuration(250)
+        self._slide_anim.setStartValue(self.pos())
+        self._slide_anim.setEndValue(QPoint(screen.width(), self.y()))
+        self._slide_anim.setEasingCurve(QEasingCurve.Type.InCubic)
+        self._slide_anim.finished.connect(self._on_closed)
+        self._slide_anim.start()
         
     def _on_closed(self) -> None:
         """Clean up after fade out."""
@@ -141,13 +145,17 @@ class ToastNotification(QWidget):
 class ToastManager:
     """
     Manages stacking multiple toast notifications.
+    
+    Each toast keeps the stack slot it was shown in. A closing toast just
+    frees its slot for the next one, so the others never have to be moved
+    (and animated) to close the gap.
     """
     _instance = None
     
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
-            cls._instance._toasts = []
+            cls._instance._slots = []  # Toast per stack position, None if free
             cls._instance._base_y = 60  # Start from top
         return cls._instance
     
@@ -156,35 +164,31 @@ class ToastManager:
         toast = ToastNotification(message, toast_type, duration_ms)
         toast.closed.connect(self._on_toast_closed)
         
-        # Position: stack from bottom-right
+        # Position: lowest free slot in the stack
+        slot = next((i for i, t in enumerate(self._slots) if t is None), len(self._slots))
+        if slot == len(self._slots):
+            self._slots.append(toast)
+        else:
+            self._slots[slot] = toast
+        
         screen = QApplication.primaryScreen().geometry()
-        x = screen.width() - toast.width() - 20
-        y = self._base_y + (len(self._toasts) * 58)
+        y = self._base_y + (slot * 58)
         
         toast.move(screen.width(), y)  # Start off-screen
-        self._toasts.append(toast)
         toast.show_toast()
         
         return toast
     
     def _on_toast_closed(self, toast: ToastNotification) -> None:
-        """Remove toast and reposition remaining."""
-        if toast in self._toasts:
-            self._toasts.remove(toast)
-        
-        # Reposition remaining toasts
-        for i, t in enumerate(self._toasts):
-            screen = QApplication.primaryScreen().geometry()
-            target_y = self._base_y + (i * 58)
-            
-            anim = QPropertyAnimation(t, b"pos")
-            anim.setDuration(200)
-            anim.setStartValue(t.pos())
-            anim.setEndValue(QPoint(t.x(), target_y))
-            anim.setEasingCurve(QEasingCurve.Type.OutCubic)
-            anim.start()
-            # Keep reference to prevent GC
-            t._reposition_anim = anim
+        """Free the closed toast's slot; the others stay where they are."""
+        for i, t in enumerate(self._slots):
+            if t is toast:
+                self._slots[i] = None
+                break
+        
+        # Drop free slots at the end so the stack shrinks back
+        while self._slots and self._slots[-1] is None:
+            self._slots.pop()
     
     @staticmethod
     def info(message: str, duration_ms: int = 3000):
@@ -6,6 +6,7 @@ Handles screen recording using MSS and OpenCV.
 import cv2
 import numpy as np
 import mss
+import queue
 import threading
 import time
 import os
@@ -24,6 +25,10 @@ class VideoEngine:
     Uses MSS for fast screen capture and OpenCV for writing video files.
     """
     
+    # Writer codecs in order of preference: H.264 (hardware encoded where the
+    # platform offers it, and far smaller files), then software MPEG-4
+    VIDEO_CODECS = ("avc1", "mp4v")
+    
     def __init__(self):
         """Initialize the video engine."""
         self._state = VideoState.STOPPED
@@ -32,16 +37,31 @@ class VideoEngine:
         self._output_path: Optional[str] = None
         self._temp_path: Optional[str] = None
         
+        # Captured frames waiting for the encoder thread; bounded so a
+        # stalled encoder drops frames instead of growing memory
+        self._frame_queue: queue.Queue = queue.Queue(maxsize=4)
+        # Written (or dropped) frame buffers, reused by the capture loop
+        self._free_frames: queue.Queue = queue.Queue()
+        
         # Recording settings
         self.fps = 15.0  # Sufficient for meetings, keeps CPU usage reasonable
         self.screen_size: Optional[Tuple[int, int]] = None
         
-    def get_monitors(self) -> list[dict]:
+        # Cached monitor list (enumeration queries the OS display tables)
+        self._monitors: Optional[list[dict]] = None
+        
+    def get_monitors(self, refresh: bool = False) -> list[dict]:
         """
         Get list of available monitors.
         Returns list of dicts with keys 'left', 'top', 'width', 'height'.
         Index 0 in return list corresponds to Monitor 1 (mss index 1).
+        
+        Args:
+            refresh: Re-enumerate monitors instead of returning the cached list.
         """
+        if self._monitors is not None and not refresh:
+            return self._monitors
+        
         monitors = []
         with mss.mss() as sct:
             # sct.monitors[0] is "All Monitors" combined.
@@ -51,6 +71,7 @@ class VideoEngine:
                 monitors = sct.monitors[1:]
             else:
                 monitors = sct.monitors # Fallback if something weird happens
+        self._monitors = monitors
         return monitors
 
     def start_recording(self, output_dir: str = ".", monitor_index: int = 0) -> bool:
@@ -113,10 +134,31 @@ class VideoEngine:
         self._state = VideoState.STOPPED
         return self._temp_path
 
+    def _open_writer(self, frame_size: Tuple[int, int]) -> cv2.VideoWriter:
+        """
+        Open the temp file for writing, preferring hardware H.264.
+        
+        Tries each of VIDEO_CODECS in turn with hardware acceleration allowed
+        and returns the first writer that opens; mp4v (software MPEG-4, widely
+        supported) is the last resort.
+        """
+        params = [cv2.VIDEOWRITER_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY]
+        for codec in self.VIDEO_CODECS:
+            video_writer = cv2.VideoWriter(
+                self._temp_path,
+                cv2.CAP_ANY,
+                cv2.VideoWriter_fourcc(*codec),
+                self.fps,
+                frame_size,
+                params
+            )
+            if video_writer.isOpened():
+                return video_writer
+            video_writer.release()
+        return video_writer
+
     def _recording_loop(self, mss_index: int) -> None:
         """Main recording loop."""
-        video_writer = None
-        
         with mss.mss() as sct:
             # Validate index
             if mss_index >= len(sct.monitors):
@@ -127,10 +169,6 @@ class VideoEngine:
             width = monitor["width"]
             height = monitor["height"]
             
-            # Initialize Video Writer
-            # mp4v is generally widely supported
-            fourcc = cv2.VideoWriter_fourcc(*'mp4v')
-            
             # Handle Retina/High-DPI displays
             # If width > 1920, downscale by 50% to save space/CPU
             scale_factor = 1.0
@@ -140,44 +178,95 @@ class VideoEngine:
             target_width = int(width * scale_factor)
             target_height = int(height * scale_factor)
             
-            video_writer = cv2.VideoWriter(
-                self._temp_path,
-                fourcc,
-                self.fps,
-                (target_width, target_height)
+            video_writer = self._open_writer((target_width, target_height))
+            
+            # Frames are written into buffers that cycle capture -> encoder ->
+            # capture, so a steady recording allocates none per frame
+            frame_shape = (target_height, target_width, 3)
+            self._free_frames = queue.Queue()
+            
+            # Encode on a separate thread so a slow write doesn't hold up capture
+            encoder_thread = threading.Thread(
+                target=self._encoder_loop,
+                args=(video_writer,),
+                daemon=True
             )
+            encoder_thread.start()
             
             frame_duration = 1.0 / self.fps
+            target_size = (target_width, target_height)
             
-            while not self._stop_event.is_set():
-                start_time = time.time()
-                
+            # Hot-loop lookups bound to locals once
+            grab = sct.grab
+            stop_is_set = self._stop_event.is_set
+            take_free_frame = self._free_frames.get_nowait
+            queue_frame = self._queue_frame
+            monotonic = time.monotonic
+            
+            next_deadline = monotonic()
+            
+            while not stop_is_set():
                 try:
                     # Capture screen
-                    img = sct.grab(monitor)
+                    img = grab(monitor)
                     
-                    # Convert to numpy array
-                    frame = np.array(img)
+                    # MSS returns BGRA; view it as BGR by skipping the alpha
+                    # byte instead of copying and converting the whole frame
+                    buf = np.frombuffer(img.bgra, dtype=np.uint8)
+                    frame = buf.reshape(img.height, img.width, 4)[:, :, :3]
                     
-                    # MSS returns BGRA, OpenCV needs BGR
-                    frame = cv2.cvtColor(frame, cv2.COLOR_BGRA2BGR)
+                    try:
+                        out = take_free_frame()
+                    except queue.Empty:
+                        out = np.empty(frame_shape, dtype=np.uint8)
                     
-                    # Resize if needed
+                    # Resize if needed, otherwise pack the view for the writer
                     if scale_factor != 1.0:
-                        frame = cv2.resize(frame, (target_width, target_height), interpolation=cv2.INTER_AREA)
+                        cv2.resize(frame, target_size, dst=out, interpolation=cv2.INTER_AREA)
+                    else:
+                        np.copyto(out, frame)
                     
-                    # Write frame
-                    if video_writer:
-                        video_writer.write(frame)
+                    queue_frame(out)
                         
                 except Exception as e:
                     print(f"Frame capture error: {e}")
                 
-                # Maintain FPS
-                elapsed = time.time() - start_time
-                wait_time = max(0, frame_duration - elapsed)
-                time.sleep(wait_time)
+                # Maintain FPS against a fixed schedule so slow frames don't
+                # accumulate drift (monotonic: immune to wall-clock changes)
+                next_deadline += frame_duration
+                sleep_for = next_deadline - monotonic()
+                if sleep_for > 0:
+                    time.sleep(sleep_for)
+                else:
+                    next_deadline = monotonic()  # Don't burst to catch up after a stall
                 
-            # Cleanup
-            if video_writer:
-                video_writer.release()
+            # Let the encoder drain what's queued, then finalize the file
+            self._frame_queue.put(None)
+            encoder_thread.join()
+            video_writer.release()
+    
+    def _queue_frame(self, frame: np.ndarray) -> None:
+        """Hand a frame to the encoder, dropping the oldest queued one if it's behind."""
+        try:
+            self._frame_queue.put_nowait(frame)
+        except queue.Full:
+            try:
+                self._free_frames.put(self._frame_queue.get_nowait())
+            except queue.Empty:
+                pass  # Encoder just took it
+            self._frame_queue.put_nowait(frame)
+    
+    def _encoder_loop(self, video_writer: cv2.VideoWriter) -> None:
+        """Write queued frames until the capture loop sends None."""
+        next_frame = self._frame_queue.get
+        write = video_writer.write
+        recycle = self._free_frames.put
+        while True:
+            frame = next_frame()
+            if frame is None:
+                break
+            try:
+                write(frame)
+            except Exception as e:
+                print(f"Frame write error: {e}")
+            recycle(frame)